@@ -43,7 +43,8 @@ class ArbitrageDetectorAgent(BaseAgent):
         # Configurable thresholds
         self.confidence_threshold = config.CONFIDENCE_THRESHOLD
         self.min_odds_spread = config.MIN_ODDS_SPREAD
-        self.neutral_range = config.ODDS_NEUTRAL_RANGE
+        self.neutral_low = config.ODDS_NEUTRAL_LOW
+        self.neutral_high = config.ODDS_NEUTRAL_HIGH
         self.strike_distance_threshold = config.STRIKE_DISTANCE_THRESHOLD_PCT / 100
         self.signal_cooldown = timedelta(seconds=60)  # Avoid spam
 
@@ -93,7 +94,7 @@ class ArbitrageDetectorAgent(BaseAgent):
             return
 
         # Find matching Kalshi markets for this symbol
-        base_symbol = config.SYMBOL_MAP.get(symbol, {}).get("base", "")
+        base_symbol = config.BASE_ASSET_BY_SYMBOL.get(symbol, "")
         if not base_symbol:
             return
 
@@ -164,16 +165,17 @@ class ArbitrageDetectorAgent(BaseAgent):
         # Larger spreads = more tolerance, smaller spreads = stricter
         if strategies.STRATEGY_DYNAMIC_NEUTRAL_RANGE:
             if spread >= 25:
-                neutral_range = (40, 60)  # Wide range for huge edges
+                neutral_low, neutral_high = 40, 60  # Wide range for huge edges
             elif spread >= 15:
-                neutral_range = (45, 55)  # Standard range
+                neutral_low, neutral_high = 45, 55  # Standard range
             else:
-                neutral_range = (47, 53)  # Tight range for small edges
+                neutral_low, neutral_high = 47, 53  # Tight range for small edges
         else:
-            neutral_range = self.neutral_range  # Use default from config
+            # Use default from config
+            neutral_low, neutral_high = self.neutral_low, self.neutral_high
 
         # Check if Kalshi odds are neutral (mispriced)
-        odds_neutral = neutral_range[0] <= yes_price <= neutral_range[1]
+        odds_neutral = neutral_low <= yes_price <= neutral_high
 
         # IMPROVEMENT 6: Strike price distance check
         strike_price = kalshi_event.strike_price
@@ -403,7 +403,7 @@ class BacktestAgent(BaseAgent):
             no_price=round(no_price, 1),
             volume=volume,
             open_interest=open_interest,
-            underlying_symbol=config.SYMBOL_MAP.get(self.symbol, {}).get("base", "BTC"),
+            underlying_symbol=config.BASE_ASSET_BY_SYMBOL.get(self.symbol, "BTC"),
             strike_price=price,
             expiration=timestamp + timedelta(hours=1),
         )
@@ -3,7 +3,7 @@ Signal Aggregator Agent - Consolidates signals and handles logging.
 """
 
 import asyncio
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set
@@ -39,6 +39,7 @@ class SignalAggregatorAgent(BaseAgent):
 
         self.log_dir = config.LOG_DIR
         self.colors = config.CONSOLE_COLORS
+        self.colors_b = config.CONSOLE_COLORS_B
 
         # Deduplication tracking
         self._recent_signals: Set[str] = set()
@@ -136,22 +137,43 @@ class SignalAggregatorAgent(BaseAgent):
 
     def _log_console(self, level: str, message: str) -> None:
         """Print colored message to console"""
-        color = self.colors.get(level, "")
-        reset = self.colors.get("RESET", "")
         timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"{color}[{timestamp}] [{level}] {message}{reset}")
+        line = f"[{timestamp}] [{level}] {message}"
+        out = sys.stdout
+        buffer = getattr(out, "buffer", None)
+        if buffer is None:
+            # Text-only stream (e.g. captured output): no binary layer to use
+            print(f"{self.colors.get(level, '')}{line}{self.colors.get('RESET', '')}")
+            return
+
+        # Pre-encoded color codes around the line, straight onto the binary
+        # buffer. Flush the text layer first so earlier print() output can't
+        # end up behind these bytes; only a terminal needs a flush afterwards
+        out.flush()
+        buffer.write(
+            self.colors_b.get(level, b"")
+            + line.encode(out.encoding or "utf-8", out.errors or "strict")
+            + self.colors_b.get("RESET", b"")
+            + b"\n"
+        )
+        if out.line_buffering:
+            buffer.flush()
 
     async def _write_to_file(self, event: BaseEvent) -> None:
         """Append event to JSON log file"""
         try:
-            entry = {
-                "logged_at": datetime.now().isoformat(),
-                "event_type": event.event_type.value,
-                **event.to_dict()
-            }
-
-            async with aiofiles.open(self._log_file_path, "a") as f:
-                await f.write(json.dumps(entry) + "\n")
+            # Splice logged_at into the front of the event's own JSON object
+            # instead of building and re-encoding a merged dict
+            entry = (
+                b'{"logged_at":"'
+                + datetime.now().isoformat().encode()
+                + b'",'
+                + event.to_json_bytes()[1:]
+                + b"\n"
+            )
+
+            async with aiofiles.open(self._log_file_path, "ab") as f:
+                await f.write(entry)
 
         except Exception as e:
             print(f"[{self.name}] Error writing to log file: {e}")
@@ -370,10 +370,12 @@ class KalshiTradingClient:
         slippage = 0.0
 
         if config.SIM_REALISTIC_MODE:
+            sim = config.SIM
+
             # 1. SLIPPAGE: Price moves against you
-            base_slip = config.SIM_SLIPPAGE_BASE_CENTS
-            size_slip = config.SIM_SLIPPAGE_PER_CONTRACT * quantity
-            volatility = config.SIM_SLIPPAGE_VOLATILITY
+            base_slip = sim.slippage_base_cents
+            size_slip = sim.slippage_per_contract * quantity
+            volatility = sim.slippage_volatility
 
             # Random component (always adverse - buying pushes price up)
             random_slip = random.uniform(0, base_slip + size_slip) * volatility
@@ -383,8 +385,8 @@ class KalshiTradingClient:
             fill_price = price + slippage
 
             # 2. LATENCY PRICE MOVEMENT: Price may move during execution delay
-            if random.random() < config.SIM_PRICE_MOVE_PROBABILITY:
-                adverse_move = random.uniform(0, config.SIM_PRICE_MOVE_MAX_CENTS)
+            if random.random() < sim.price_move_probability:
+                adverse_move = random.uniform(0, sim.price_move_max_cents)
                 fill_price += adverse_move
                 slippage += adverse_move
 
@@ -392,13 +394,13 @@ class KalshiTradingClient:
             fill_price = min(fill_price, 99.0)
 
             # 3. PARTIAL FILLS: May not get full quantity
-            if random.random() > config.SIM_FILL_RATE_BASE:
+            if random.random() > sim.fill_rate_base:
                 # Partial fill
-                fill_rate = random.uniform(config.SIM_MIN_FILL_RATE, 0.95)
+                fill_rate = random.uniform(sim.min_fill_rate, 0.95)
                 filled_quantity = max(1, int(quantity * fill_rate))
 
             # 4. FEES: Kalshi taker fee per contract
-            fees = config.SIM_TAKER_FEE_CENTS * filled_quantity
+            fees = sim.taker_fee_cents * filled_quantity
 
         # Calculate actual cost
         cost_cents = fill_price * filled_quantity + fees
@@ -23,6 +23,40 @@ from typing import Dict, List, Tuple, Any
 import statistics
 
 
+def find_strategies_by_impact_from(
+    impact_analysis: Dict[str, Dict[str, float]], top_n: int = 10
+) -> List[Tuple[str, Dict[str, float]]]:
+    """Rank strategies by individual impact from a precomputed impact table"""
+    ranked = sorted(
+        impact_analysis.items(),
+        key=lambda x: x[1]["impact"],
+        reverse=True
+    )
+
+    return ranked[:top_n]
+
+
+def identify_noise_strategies_from(
+    impact_analysis: Dict[str, Dict[str, float]], threshold: float = 50.0
+) -> List[str]:
+    """Identify strategies that add little value (below threshold)
+
+    These strategies might be:
+    - Adding filtering that removes profitable trades
+    - Slightly reducing win rate without improving P&L
+    - Contributing noise rather than signal
+    """
+    noise_strategies = []
+    for strategy, analysis in impact_analysis.items():
+        # Strategy has negative or very small impact
+        if analysis["impact"] < threshold:
+            # And it reduces win rate significantly
+            if analysis["wr_on"] < analysis["wr_off"] - 2.0:  # >2% reduction
+                noise_strategies.append(strategy)
+
+    return sorted(noise_strategies)
+
+
 class PermutationAnalyzer:
     """Analyze strategy permutation testing results"""
 
@@ -116,35 +150,14 @@ class PermutationAnalyzer:
 
     def find_strategies_by_impact(self, top_n: int = 10) -> List[Tuple[str, float]]:
         """Rank strategies by individual impact"""
-        impact_analysis = self.calculate_strategy_impact()
-
-        ranked = sorted(
-            impact_analysis.items(),
-            key=lambda x: x[1]["impact"],
-            reverse=True
-        )
-
-        return ranked[:top_n]
+        return find_strategies_by_impact_from(self.calculate_strategy_impact(), top_n)
 
     def identify_noise_strategies(self, threshold: float = 50.0) -> List[str]:
         """Identify strategies that add little value (below threshold)
 
-        These strategies might be:
-        - Adding filtering that removes profitable trades
-        - Slightly reducing win rate without improving P&L
-        - Contributing noise rather than signal
+        See identify_noise_strategies_from() for the criteria.
         """
-        impact_analysis = self.calculate_strategy_impact()
-
-        noise_strategies = []
-        for strategy, analysis in impact_analysis.items():
-            # Strategy has negative or very small impact
-            if analysis["impact"] < threshold:
-                # And it reduces win rate significantly
-                if analysis["wr_on"] < analysis["wr_off"] - 2.0:  # >2% reduction
-                    noise_strategies.append(strategy)
-
-        return sorted(noise_strategies)
+        return identify_noise_strategies_from(self.calculate_strategy_impact(), threshold)
 
     def identify_synergistic_pairs(self) -> List[Tuple[str, str, float]]:
         """Identify strategy pairs that work well together
@@ -228,6 +241,9 @@ class PermutationAnalyzer:
         if not self.results:
             return "No results to analyze"
 
+        # Scanning every result per strategy is the dominant cost; do it once
+        impact_analysis = self.calculate_strategy_impact()
+
         report = []
         report.append("=" * 100)
         report.append("STRATEGY PERMUTATION ANALYSIS")
@@ -265,8 +281,7 @@ class PermutationAnalyzer:
         report.append(f"{'Strategy':<40} {'Impact':>10} {'ON Avg P&L':>12} {'OFF Avg P&L':>12} {'Win Rate Δ':>10}")
         report.append("-" * 90)
 
-        impact_analysis = self.calculate_strategy_impact()
-        sorted_impact = sorted(impact_analysis.items(), key=lambda x: x[1]["impact"], reverse=True)
+        sorted_impact = find_strategies_by_impact_from(impact_analysis, top_n=len(impact_analysis))
 
         for strategy, analysis in sorted_impact:
             delta_wr = analysis["wr_on"] - analysis["wr_off"]
@@ -278,7 +293,7 @@ class PermutationAnalyzer:
             )
 
         # Noise strategies
-        noise_strats = self.identify_noise_strategies(threshold=20.0)
+        noise_strats = identify_noise_strategies_from(impact_analysis, threshold=20.0)
         if noise_strats:
             report.append(f"\n⚠️ POSSIBLE NOISE STRATEGIES (may be filtering good trades)")
             for strat in noise_strats:
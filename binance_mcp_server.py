@@ -6,7 +6,10 @@ An MCP (Model Context Protocol) server that provides Claude with direct access t
 Binance.US market data, order books, and trading capabilities.
 
 Installation:
-    pip install mcp httpx pydantic
+    pip install mcp httpx pydantic numpy
+    pip install orjson  # optional, faster JSON parsing and output
+    pip install "httpx[http2]"  # optional, HTTP/2 to Binance.US
+    pip install uvloop  # optional, faster event loop on Linux/macOS
 
 Usage (Standalone):
     python binance_us_mcp_server.py
@@ -17,15 +20,33 @@ Usage (Claude Desktop):
     3. Ask Claude about Binance.US data
 """
 
-import httpx
+import asyncio
+import heapq
 import json
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+import re
+import time
+import httpx
+import numpy as np
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Annotated, AsyncIterator, Optional, List, Dict, Any
+from pydantic import Field, ConfigDict
 from mcp.server.fastmcp import FastMCP
 
+# orjson parses and dumps much faster (and handles NumPy arrays natively);
+# it's optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Initialize MCP Server
-mcp = FastMCP("binance_us_mcp")
+# HTTP/2 needs httpx's optional h2 extra (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 
 # ============================================================================
@@ -35,207 +56,300 @@ mcp = FastMCP("binance_us_mcp")
 BINANCE_US_API_URL = "https://api.binance.us/api/v3"
 REQUEST_TIMEOUT = 10.0
 
+# Short-lived response cache TTLs (seconds). Agents tend to call several tools
+# back-to-back for the same symbol; endpoints not listed here are never cached.
+CACHE_TTL_SECONDS = {
+    "/ticker/24hr": 10.0,
+    "/depth": 10.0,
+}
+KLINES_1M_CACHE_TTL_SECONDS = 30.0
+
+# Compiled once at import; validators run on every tool call
+_SYMBOL_RE = re.compile(r'\A[A-Za-z0-9_]{4,12}\Z')
+_VALID_INTERVALS = frozenset({
+    '1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M'
+})
+_VALID_INTERVALS_ERR = "Invalid interval. Must be one of: " + ", ".join(sorted(_VALID_INTERVALS))
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy values for the json module fallback"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response as indented JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON response body"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 # ============================================================================
-# Pydantic Input Models
+# Shared HTTP Client
 # ============================================================================
 
-class GetOrderBookInput(BaseModel):
+# One keep-alive connection pool for the lifetime of the server, so tool calls
+# skip the TCP + TLS handshake after the first request.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it inside the running event loop"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=BINANCE_US_API_URL,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+            http2=HTTP2_AVAILABLE,
+        )
+    return _http_client
+
+
+async def _close_client() -> None:
+    """Close the shared AsyncClient if it was opened"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Release pooled connections when the MCP server shuts down"""
+    try:
+        yield
+    finally:
+        await _close_client()
+
+
+# Initialize MCP Server
+mcp = FastMCP("binance_us_mcp", lifespan=_lifespan)
+
+
+# ============================================================================
+# Input Models
+# ============================================================================
+#
+# Plain slotted dataclasses: FastMCP/Pydantic still validates tool arguments
+# from the Annotated Field constraints at the MCP boundary, and __post_init__
+# runs the symbol/interval checks without the cost of a BaseModel instance.
+
+_INPUT_CONFIG = ConfigDict(str_strip_whitespace=True, extra='forbid')
+
+
+def _check_symbol(v: str) -> str:
+    """Validate symbol format (alphanumeric) and return it uppercased"""
+    if not _SYMBOL_RE.match(v):
+        raise ValueError("Symbol must be alphanumeric (e.g., BTCUSDT)")
+    return v.upper()
+
+
+def _check_interval(v: str) -> str:
+    """Validate interval format (lowercase, e.g., 1m, 5m, 1h; '1M' is monthly)"""
+    lower = v.lower()
+    if lower not in _VALID_INTERVALS and v not in _VALID_INTERVALS:
+        raise ValueError(_VALID_INTERVALS_ERR)
+    return lower if v != '1M' else v
+
+
+@dataclass(slots=True, frozen=True)
+class GetOrderBookInput:
     """Input model for getting order book data"""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-
-    symbol: str = Field(
-        ...,
+    __pydantic_config__ = _INPUT_CONFIG
+
+    symbol: Annotated[str, Field(
         description="Trading pair symbol (e.g., 'BTCUSDT', 'SOLUSDT', 'ETHUSDT')",
         min_length=4,
         max_length=12
-    )
-    limit: Optional[int] = Field(
-        default=20,
+    )]
+    limit: Annotated[Optional[int], Field(
         description="Number of bid/ask levels to return (1-5000, default 20)",
         ge=1,
         le=5000
-    )
+    )] = 20
 
-    @field_validator('symbol')
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """Validate symbol format (uppercase alphanumeric)"""
-        if not v.replace('_', '').isalnum():
-            raise ValueError("Symbol must be alphanumeric (e.g., BTCUSDT)")
-        return v.upper()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "symbol", _check_symbol(self.symbol))
 
 
-class GetTickerInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GetTickerInput:
     """Input model for getting ticker data"""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-
-    symbol: Optional[str] = Field(
-        default=None,
+    __pydantic_config__ = _INPUT_CONFIG
+
+    symbol: Annotated[Optional[str], Field(
         description="Trading pair symbol (e.g., 'BTCUSDT'). Leave blank for all symbols",
         min_length=4,
         max_length=12
-    )
+    )] = None
 
-    @field_validator('symbol')
-    @classmethod
-    def validate_symbol(cls, v: Optional[str]) -> Optional[str]:
-        """Validate symbol format"""
-        if v is not None and not v.replace('_', '').isalnum():
-            raise ValueError("Symbol must be alphanumeric (e.g., BTCUSDT)")
-        return v.upper() if v else None
+    def __post_init__(self) -> None:
+        if self.symbol is not None:
+            object.__setattr__(self, "symbol", _check_symbol(self.symbol))
 
 
-class GetKlinesInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class GetKlinesInput:
     """Input model for getting candlestick data"""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-
-    symbol: str = Field(
-        ...,
+    __pydantic_config__ = _INPUT_CONFIG
+
+    symbol: Annotated[str, Field(
         description="Trading pair symbol (e.g., 'BTCUSDT')",
         min_length=4,
         max_length=12
-    )
-    interval: str = Field(
-        default="1m",
+    )]
+    interval: Annotated[str, Field(
         description="Candle interval: 1m, 5m, 15m, 30m, 1h, 4h, 1d, etc.",
         min_length=2,
         max_length=3
-    )
-    limit: Optional[int] = Field(
-        default=100,
+    )] = "1m"
+    limit: Annotated[Optional[int], Field(
         description="Number of candles to return (1-1000, default 100)",
         ge=1,
         le=1000
-    )
-
-    @field_validator('symbol')
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """Validate symbol format (uppercase alphanumeric)"""
-        if not v.replace('_', '').isalnum():
-            raise ValueError("Symbol must be alphanumeric")
-        return v.upper()
-
-    @field_validator('interval')
-    @classmethod
-    def validate_interval(cls, v: str) -> str:
-        """Validate interval format (lowercase, e.g., 1m, 5m, 1h)"""
-        valid_intervals = {'1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M'}
-        if v.lower() not in valid_intervals and v not in valid_intervals:
-            raise ValueError(f"Invalid interval. Must be one of: {', '.join(sorted(valid_intervals))}")
-        return v.lower() if v != '1M' else v
-
-
-class GetAccountInfoInput(BaseModel):
+    )] = 100
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "symbol", _check_symbol(self.symbol))
+        object.__setattr__(self, "interval", _check_interval(self.interval))
+
+
+@dataclass(slots=True, frozen=True)
+class GetAccountInfoInput:
     """Input model for getting account information"""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-
-    include_balances: bool = Field(
-        default=True,
+    __pydantic_config__ = _INPUT_CONFIG
+
+    include_balances: Annotated[bool, Field(
         description="Include account balances in response"
-    )
+    )] = True
 
 
-class AnalyzePriceMomentumInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AnalyzePriceMomentumInput:
     """Input model for analyzing price momentum"""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-
-    symbol: str = Field(
-        ...,
+    __pydantic_config__ = _INPUT_CONFIG
+
+    symbol: Annotated[str, Field(
         description="Trading pair symbol (e.g., 'SOLUSDT')",
         min_length=4,
         max_length=12
-    )
-    minutes_window: Optional[int] = Field(
-        default=60,
-        description="Number of minutes to analyze (1-1440)",
+    )]
+    minutes_window: Annotated[Optional[int], Field(
+        description="Number of minutes to analyze (1-1000, the Binance klines limit)",
         ge=1,
-        le=1440
-    )
+        le=1000
+    )] = 60
 
-    @field_validator('symbol')
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """Validate symbol format"""
-        if not v.replace('_', '').isalnum():
-            raise ValueError("Symbol must be alphanumeric")
-        return v.upper()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "symbol", _check_symbol(self.symbol))
 
 
-class DetectTemporalLagInput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class DetectTemporalLagInput:
     """Input model for detecting temporal arbitrage lag"""
-    model_config = ConfigDict(
-        str_strip_whitespace=True,
-        validate_assignment=True,
-        extra='forbid'
-    )
-
-    symbol: str = Field(
-        ...,
+    __pydantic_config__ = _INPUT_CONFIG
+
+    symbol: Annotated[str, Field(
         description="Trading pair symbol (e.g., 'SOLUSDT')",
         min_length=4,
         max_length=12
-    )
-    confidence_threshold: Optional[float] = Field(
-        default=70.0,
+    )]
+    confidence_threshold: Annotated[Optional[float], Field(
         description="Confidence threshold percentage (0-100, default 70)",
         ge=0,
         le=100
-    )
+    )] = 70.0
 
-    @field_validator('symbol')
-    @classmethod
-    def validate_symbol(cls, v: str) -> str:
-        """Validate symbol format"""
-        if not v.replace('_', '').isalnum():
-            raise ValueError("Symbol must be alphanumeric")
-        return v.upper()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "symbol", _check_symbol(self.symbol))
 
 
 # ============================================================================
 # Binance.US API Client
 # ============================================================================
 
-class BinanceUSClient:
-    """HTTP client for Binance.US API"""
+# (endpoint, frozenset(params)) -> (monotonic expiry time, decoded response).
+# Expired entries are pruned whenever a new response is stored.
+_response_cache: Dict[tuple, tuple] = {}
+# Per-key locks for requests currently being fetched; removed once done
+_cache_locks: Dict[tuple, asyncio.Lock] = {}
 
-    def __init__(self, base_url: str = BINANCE_US_API_URL, timeout: float = REQUEST_TIMEOUT):
-        self.base_url = base_url
-        self.timeout = timeout
+
+def _store_response(key: tuple, ttl: float, data: Any) -> None:
+    """Cache a response for ttl seconds and drop any expired entries"""
+    now = time.monotonic()
+    expired = [k for k, (expires_at, _) in _response_cache.items() if expires_at <= now]
+    for k in expired:
+        del _response_cache[k]
+    _response_cache[key] = (now + ttl, data)
+
+
+def _cache_ttl(endpoint: str, params: Optional[Dict[str, Any]]) -> float:
+    """Return how long a response for this request may be reused (0 = never)"""
+    if endpoint == "/klines":
+        if params and params.get("interval") == "1m":
+            return KLINES_1M_CACHE_TTL_SECONDS
+        return 0.0
+    return CACHE_TTL_SECONDS.get(endpoint, 0.0)
+
+
+class BinanceUSClient:
+    """HTTP client for Binance.US API (thin wrapper over the shared AsyncClient)"""
 
     async def request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Make HTTP request to Binance.US API"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                url = f"{self.base_url}{endpoint}"
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                raise Exception(f"Binance.US API error: {str(e)}")
-            except json.JSONDecodeError as e:
-                raise Exception(f"Invalid JSON response from Binance.US: {str(e)}")
+        """Make HTTP request to Binance.US API, served from the TTL cache when fresh"""
+        ttl = _cache_ttl(endpoint, params)
+        if ttl <= 0:
+            return await self._fetch(endpoint, params)
+
+        key = (endpoint, frozenset(params.items()) if params else frozenset())
+        cached = _response_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # Collapse concurrent identical requests into a single fetch. The
+        # caller that created the lock removes it when done; anyone still
+        # waiting on it finds the fresh response once they acquire it.
+        lock = _cache_locks.get(key)
+        created = lock is None
+        if created:
+            lock = _cache_locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                cached = _response_cache.get(key)
+                if cached is not None and time.monotonic() < cached[0]:
+                    return cached[1]
+                data = await self._fetch(endpoint, params)
+                _store_response(key, ttl, data)
+                return data
+        finally:
+            if created and _cache_locks.get(key) is lock:
+                del _cache_locks[key]
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Perform the HTTP GET and decode the JSON body"""
+        try:
+            response = await _get_client().get(endpoint, params=params)
+            if response.status_code >= 400:
+                raise Exception(
+                    f"Binance.US API error: HTTP {response.status_code} for {endpoint}: {response.text}"
+                )
+            # Binance always sends UTF-8 JSON; parse the raw bytes directly
+            return _loads(response.content)
+        except httpx.HTTPError as e:
+            raise Exception(f"Binance.US API error: {str(e)}")
+        except json.JSONDecodeError as e:  # orjson's error subclasses this
+            raise Exception(f"Invalid JSON response from Binance.US: {str(e)}")
 
     async def get_order_book(self, symbol: str, limit: int = 20) -> Dict[str, Any]:
         """Get order book for a trading pair"""
@@ -274,6 +388,53 @@ class BinanceUSClient:
         }
 
 
+# Stateless wrapper shared by every tool (the connection pool lives in _get_client)
+_BINANCE = BinanceUSClient()
+
+
+# ============================================================================
+# Shared Analysis Helpers
+# ============================================================================
+
+# Momentum stats are reused for MOMENTUM_MEMO_SECONDS so back-to-back momentum
+# and lag calls for the same symbol share one fetch and one reduction.
+MOMENTUM_MEMO_SECONDS = 10
+_momentum_memo: Dict[tuple, Optional[Dict[str, Any]]] = {}
+
+
+async def _momentum_stats(symbol: str, minutes: int) -> Optional[Dict[str, Any]]:
+    """Count up/down 1m candles over the last `minutes` (None if no data)"""
+    bucket = int(time.time() // MOMENTUM_MEMO_SECONDS)
+    key = (symbol, minutes, bucket)
+    if key in _momentum_memo:
+        return _momentum_memo[key]
+
+    klines = await _BINANCE.get_klines(symbol, "1m", minutes)
+
+    stats = None
+    if klines:
+        arr = np.array(klines, dtype=object)
+        opens = arr[:, 1].astype(np.float64)
+        closes = arr[:, 4].astype(np.float64)
+        total = len(klines)
+        candles_up = int((closes >= opens).sum())
+        candles_down = total - candles_up
+        stats = {
+            "total": total,
+            "candles_up": candles_up,
+            "candles_down": candles_down,
+            "up_percentage": candles_up / total * 100,
+            "down_percentage": candles_down / total * 100,
+            "latest_price": float(closes[-1]),
+        }
+
+    # Drop entries from earlier buckets so the memo stays bounded
+    for stale in [k for k in _momentum_memo if k[2] != bucket]:
+        del _momentum_memo[stale]
+    _momentum_memo[key] = stats
+    return stats
+
+
 # ============================================================================
 # MCP Tools
 # ============================================================================
@@ -304,20 +465,29 @@ async def get_order_book(params: GetOrderBookInput) -> str:
     Returns:
         str: JSON formatted order book with bids and asks
     """
+    symbol = params.symbol
     try:
-        client = BinanceUSClient()
-        order_book = await client.get_order_book(params.symbol, params.limit)
-
-        return json.dumps({
+        client = _BINANCE
+        order_book = await client.get_order_book(symbol, params.limit)
+
+        bids = order_book.get("bids") or []
+        asks = order_book.get("asks") or []
+        spread = None
+        if bids and asks:
+            bid0 = float(bids[0][0])
+            ask0 = float(asks[0][0])
+            spread = f"{(ask0 - bid0) / bid0 * 100:.4f}%"
+
+        return _dumps({
             "status": "success",
-            "symbol": params.symbol,
-            "bids": order_book.get("bids", [])[:params.limit],
-            "asks": order_book.get("asks", [])[:params.limit],
+            "symbol": symbol,
+            "bids": bids[:params.limit],
+            "asks": asks[:params.limit],
             "timestamp": order_book.get("E", "unknown"),
-            "spread": f"{((float(order_book['asks'][0][0]) - float(order_book['bids'][0][0])) / float(order_book['bids'][0][0]) * 100):.4f}% (if available)"
-        }, indent=2)
+            "spread": spread
+        })
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)}, indent=2)
+        return _dumps({"status": "error", "message": str(e)})
 
 
 @mcp.tool(
@@ -344,15 +514,16 @@ async def get_ticker(params: GetTickerInput) -> str:
     Returns:
         str: JSON formatted ticker data with price and volume statistics
     """
+    symbol = params.symbol
     try:
-        client = BinanceUSClient()
-        ticker_data = await client.get_ticker(params.symbol)
+        client = _BINANCE
+        ticker_data = await client.get_ticker(symbol)
 
-        if params.symbol:
+        if symbol:
             # Single ticker
-            return json.dumps({
+            return _dumps({
                 "status": "success",
-                "symbol": params.symbol,
+                "symbol": symbol,
                 "price": ticker_data.get("lastPrice", "N/A"),
                 "priceChange24h": ticker_data.get("priceChange", "N/A"),
                 "priceChangePercent24h": ticker_data.get("priceChangePercent", "N/A"),
@@ -362,16 +533,16 @@ async def get_ticker(params: GetTickerInput) -> str:
                 "low24h": ticker_data.get("lowPrice", "N/A"),
                 "bidPrice": ticker_data.get("bidPrice", "N/A"),
                 "askPrice": ticker_data.get("askPrice", "N/A")
-            }, indent=2)
+            })
         else:
             # Multiple tickers - return top 10 by volume
-            tickers = sorted(
+            tickers = heapq.nlargest(
+                10,
                 ticker_data,
-                key=lambda x: float(x.get("quoteAssetVolume", 0)),
-                reverse=True
-            )[:10]
+                key=lambda x: float(x.get("quoteAssetVolume", 0))
+            )
 
-            return json.dumps({
+            return _dumps({
                 "status": "success",
                 "count": len(tickers),
                 "top_10_by_volume": [
@@ -383,9 +554,9 @@ async def get_ticker(params: GetTickerInput) -> str:
                     }
                     for t in tickers
                 ]
-            }, indent=2)
+            })
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)}, indent=2)
+        return _dumps({"status": "error", "message": str(e)})
 
 
 @mcp.tool(
@@ -412,35 +583,41 @@ async def get_klines(params: GetKlinesInput) -> str:
             - limit (int): Number of candles (1-1000, default 100)
 
     Returns:
-        str: JSON formatted candlestick data with OHLCV values
+        str: JSON formatted candlestick data with OHLCV values, one array per
+             field (candles.close[i] is the close of the i-th candle)
     """
+    symbol = params.symbol
     try:
-        client = BinanceUSClient()
-        klines = await client.get_klines(params.symbol, params.interval, params.limit)
-
-        formatted_candles = []
-        for k in klines:
-            formatted_candles.append({
-                "openTime": k[0],
-                "open": float(k[1]),
-                "high": float(k[2]),
-                "low": float(k[3]),
-                "close": float(k[4]),
-                "volume": float(k[5]),
-                "closeTime": k[6],
-                "quoteAssetVolume": float(k[7]),
-                "numberOfTrades": k[8]
-            })
+        client = _BINANCE
+        klines = await client.get_klines(symbol, params.interval, params.limit)
+
+        # Column-oriented (one array per field) so orjson, when installed, can
+        # serialize the NumPy buffers directly instead of walking a dict per candle
+        arr = np.array(klines, dtype=object) if klines else np.empty((0, 9), dtype=object)
+        # Convert open/high/low/close/volume in one pass; each row of the
+        # transposed, C-contiguous result is itself a contiguous column
+        open_, high, low, closes, volume = np.ascontiguousarray(arr[:, 1:6].T, dtype=np.float64)
+        candles = {
+            "openTime": arr[:, 0].astype(np.int64),
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": closes,
+            "volume": volume,
+            "closeTime": arr[:, 6].astype(np.int64),
+            "quoteAssetVolume": arr[:, 7].astype(np.float64),
+            "numberOfTrades": arr[:, 8].astype(np.int64),
+        }
 
-        return json.dumps({
+        return _dumps({
             "status": "success",
-            "symbol": params.symbol,
+            "symbol": symbol,
             "interval": params.interval,
-            "candles": formatted_candles,
-            "latestPrice": float(formatted_candles[-1]["close"]) if formatted_candles else None
-        }, indent=2)
+            "candles": candles,
+            "latestPrice": float(closes[-1]) if len(closes) else None
+        })
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)}, indent=2)
+        return _dumps({"status": "error", "message": str(e)})
 
 
 @mcp.tool(
@@ -464,34 +641,31 @@ async def analyze_price_momentum(params: AnalyzePriceMomentumInput) -> str:
     Args:
         params (AnalyzePriceMomentumInput): Validated input containing:
             - symbol (str): Trading pair (e.g., 'SOLUSDT')
-            - minutes_window (int): Window to analyze in minutes (default 60)
+            - minutes_window (int): Window to analyze in minutes (1-1000, default 60)
 
     Returns:
         str: JSON formatted analysis with momentum metrics
     """
+    symbol = params.symbol
     try:
-        client = BinanceUSClient()
-        limit = params.minutes_window if params.minutes_window <= 1000 else 1000
-        klines = await client.get_klines(params.symbol, "1m", limit)
+        stats = await _momentum_stats(symbol, params.minutes_window)
 
-        if not klines:
-            return json.dumps({"status": "error", "message": f"No data for {params.symbol}"}, indent=2)
+        if stats is None:
+            return _dumps({"status": "error", "message": f"No data for {symbol}"})
 
-        # Analyze candles
-        candles_up = sum(1 for k in klines if float(k[4]) >= float(k[1]))
-        candles_down = len(klines) - candles_up
-        total = len(klines)
-
-        up_percentage = (candles_up / total) * 100 if total > 0 else 0
-        down_percentage = (candles_down / total) * 100 if total > 0 else 0
+        total = stats["total"]
+        candles_up = stats["candles_up"]
+        candles_down = stats["candles_down"]
+        up_percentage = stats["up_percentage"]
+        down_percentage = stats["down_percentage"]
 
         # Determine confirmation
         up_confirmed = up_percentage > 60
         down_confirmed = down_percentage > 60
 
-        return json.dumps({
+        return _dumps({
             "status": "success",
-            "symbol": params.symbol,
+            "symbol": symbol,
             "timeWindow": f"{params.minutes_window} minutes",
             "totalCandles": total,
             "candlesUp": candles_up,
@@ -500,11 +674,11 @@ async def analyze_price_momentum(params: AnalyzePriceMomentumInput) -> str:
             "downPercentage": round(down_percentage, 2),
             "upConfirmed": up_confirmed,
             "downConfirmed": down_confirmed,
-            "latestPrice": float(klines[-1][4]),
+            "latestPrice": stats["latest_price"],
             "analysis": "Strong UP momentum" if up_confirmed else ("Strong DOWN momentum" if down_confirmed else "No clear direction")
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)}, indent=2)
+        return _dumps({"status": "error", "message": str(e)})
 
 
 @mcp.tool(
@@ -533,20 +707,15 @@ async def detect_temporal_lag(params: DetectTemporalLagInput) -> str:
     Returns:
         str: JSON formatted lag detection analysis
     """
+    symbol = params.symbol
     try:
-        client = BinanceUSClient()
-        klines = await client.get_klines(params.symbol, "1m", 60)
+        stats = await _momentum_stats(symbol, 60)
 
-        if not klines:
-            return json.dumps({"status": "error", "message": f"No data for {params.symbol}"}, indent=2)
+        if stats is None:
+            return _dumps({"status": "error", "message": f"No data for {symbol}"})
 
-        # Analyze candles
-        candles_up = sum(1 for k in klines if float(k[4]) >= float(k[1]))
-        candles_down = len(klines) - candles_up
-        total = len(klines)
-
-        up_percentage = (candles_up / total) * 100 if total > 0 else 0
-        down_percentage = (candles_down / total) * 100 if total > 0 else 0
+        up_percentage = stats["up_percentage"]
+        down_percentage = stats["down_percentage"]
 
         # Check for exploitable lag
         lag_detected = False
@@ -562,9 +731,9 @@ async def detect_temporal_lag(params: DetectTemporalLagInput) -> str:
             exploitable_direction = "DOWN"
             lag_description = f"Spot price shows strong DOWN momentum ({down_percentage:.1f}% of candles down). If Polymarket still offers 50/50 odds, this is exploitable."
 
-        return json.dumps({
+        return _dumps({
             "status": "success",
-            "symbol": params.symbol,
+            "symbol": symbol,
             "lagDetected": lag_detected,
             "exploitableDirection": exploitable_direction,
             "lagDescription": lag_description if lag_detected else "No clear directional confirmation detected",
@@ -572,10 +741,10 @@ async def detect_temporal_lag(params: DetectTemporalLagInput) -> str:
             "downPercentage": round(down_percentage, 2),
             "confidenceThreshold": params.confidence_threshold,
             "recommendation": f"✅ EXPLOITABLE LAG: Buy '{exploitable_direction}' on Polymarket at 50/50 odds if spot shows {exploitable_direction} momentum" if lag_detected else "❌ No exploitable lag detected at this time",
-            "latestPrice": float(klines[-1][4])
-        }, indent=2)
+            "latestPrice": stats["latest_price"]
+        })
     except Exception as e:
-        return json.dumps({"status": "error", "message": str(e)}, indent=2)
+        return _dumps({"status": "error", "message": str(e)})
 
 
 # ============================================================================
@@ -584,8 +753,6 @@ async def detect_temporal_lag(params: DetectTemporalLagInput) -> str:
 
 if __name__ == "__main__":
     # Run the MCP server
-    import asyncio
-
     print("🚀 Starting Binance.US MCP Server...")
     print(f"📡 API Endpoint: {BINANCE_US_API_URL}")
     print("Available tools:")
@@ -596,5 +763,12 @@ if __name__ == "__main__":
     print("  • binance_detect_temporal_lag")
     print("\n✅ Server initialized. Ready to accept MCP connections...")
 
+    # Prefer uvloop's libuv-based event loop when available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the server
     mcp.run()
\ No newline at end of file
@@ -1,15 +1,26 @@
 """
 Lightweight cache for Kalshi and Binance historical data.
 
-Uses SQLite - no external dependencies, survives restarts.
+Uses SQLite - no database server needed, survives restarts.
 """
 
+import atexit
+import calendar
 import json
 import logging
+import operator
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+import numpy as np
 
 import config
 
@@ -17,80 +28,443 @@ logger = logging.getLogger(__name__)
 
 DB_PATH = config.LOG_DIR / "cache.db"
 
+# Per-connection tuning. journal_mode=WAL is persistent in the file and is set
+# once in _init_db; these have to be replayed on every new connection.
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Routine (non-forced) integrity checks are skipped if one ran this recently
+INTEGRITY_CHECK_INTERVAL_SECONDS = 24 * 60 * 60
+
+# Packed row layout for get_binance_klines_array (48 bytes per candle)
+KLINE_DTYPE = np.dtype([
+    ("timestamp", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+])
+
+# Rows per write transaction: large enough to amortize the commit, small
+# enough to bound WAL growth on very large saves.
+WRITE_BATCH_ROWS = 50_000
+
+# Page size for newly created files (shallower b-trees, fewer page reads on
+# kline range scans); existing files keep whatever they were created with
+PAGE_SIZE = 16384
+
+# Free pages returned to the OS per incremental_vacuum step
+INCREMENTAL_VACUUM_PAGES = 1000
+
+# Pending saves the background writer may hold before save_* calls block
+WRITE_QUEUE_SIZE = 16
+
+# How long the writer waits for more saves to merge into one transaction
+WRITE_COALESCE_SECONDS = 0.05
+
+# Refresh planner statistics after saves larger than this many rows
+OPTIMIZE_AFTER_ROWS = 10_000
+
+# Column definitions for the data tables, keyed by table name. fetched_at is
+# unix seconds; files written before that change stored ISO-8601 text and are
+# rebuilt by _migrate_fetched_at.
+TABLE_COLUMNS = {
+    "kalshi_trades_v2": """
+        timestamp INTEGER,
+        ticker TEXT,
+        yes_price REAL,
+        no_price REAL,
+        market_result TEXT,
+        fetched_at INTEGER,
+        PRIMARY KEY (timestamp, ticker)
+    """,
+    "kalshi_candles": """
+        timestamp INTEGER,
+        ticker TEXT,
+        yes_price REAL,
+        no_price REAL,
+        market_result TEXT,
+        fetched_at INTEGER,
+        PRIMARY KEY (timestamp, ticker)
+    """,
+    "binance_klines": """
+        symbol TEXT,
+        timestamp INTEGER,
+        open REAL,
+        high REAL,
+        low REAL,
+        close REAL,
+        volume REAL,
+        fetched_at INTEGER,
+        PRIMARY KEY (symbol, timestamp)
+    """,
+}
+
+
+@lru_cache(maxsize=None)
+def _ticker_range_sql(table: str) -> str:
+    """SELECT for a JSON array of tickers in a time range.
+
+    The tickers are bound as a single JSON parameter and expanded with
+    json_each(), which SQLite turns into an ephemeral lookup table. Any number
+    of tickers runs as one statement with one plan, with no variable-limit
+    chunking, and it works on the read-only (query_only) connections.
+    """
+    return f"""
+        SELECT timestamp, ticker, yes_price, no_price, market_result
+        FROM {table}
+        WHERE ticker IN (SELECT value FROM json_each(?))
+          AND timestamp BETWEEN ? AND ?
+    """
+
+
+def _partition_for(ts: int) -> str:
+    """Month partition key (YYYY_MM, UTC) for a millisecond timestamp."""
+    return time.strftime("%Y_%m", time.gmtime(ts // 1000))
+
+
+def _partition_bounds(key: str) -> tuple:
+    """[start, end) millisecond timestamps covered by a partition key."""
+    year, month = map(int, key.split("_"))
+    next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return (
+        calendar.timegm((year, month, 1, 0, 0, 0)) * 1000,
+        calendar.timegm((next_year, next_month, 1, 0, 0, 0)) * 1000,
+    )
+
+
+def _partition_schema(key: str) -> str:
+    """Schema name a partition is ATTACHed under."""
+    return f"p_{key}"
+
+
+@lru_cache(maxsize=None)
+def _kline_upsert_sql(schema: str) -> str:
+    """Upsert into one schema's binance_klines, skipping unchanged rows."""
+    return f"""
+        INSERT INTO {schema}.binance_klines AS k
+        (symbol, timestamp, open, high, low, close, volume, fetched_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (symbol, timestamp) DO UPDATE SET
+            open = excluded.open,
+            high = excluded.high,
+            low = excluded.low,
+            close = excluded.close,
+            volume = excluded.volume,
+            fetched_at = excluded.fetched_at
+        WHERE k.open IS NOT excluded.open
+           OR k.high IS NOT excluded.high
+           OR k.low IS NOT excluded.low
+           OR k.close IS NOT excluded.close
+           OR k.volume IS NOT excluded.volume
+    """
+
+
+def _install_row_counter(conn: sqlite3.Connection, table: str):
+    """Keep cache_meta's row_count:<table> in step with the table via triggers.
+
+    The counter is seeded with one COUNT(*) when it doesn't exist yet, so
+    files written before counters were added start out exact. Must run in
+    the same transaction as any writes it could race with.
+    """
+    key = f"row_count:{table}"
+    if conn.execute("SELECT 1 FROM cache_meta WHERE key = ?", (key,)).fetchone() is None:
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        conn.execute("INSERT INTO cache_meta (key, value) VALUES (?, ?)", (key, count))
+    # Upserts that take the DO UPDATE path don't fire the insert trigger
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_count_insert AFTER INSERT ON {table}
+        BEGIN
+            UPDATE cache_meta SET value = value + 1 WHERE key = '{key}';
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_count_delete AFTER DELETE ON {table}
+        BEGIN
+            UPDATE cache_meta SET value = value - 1 WHERE key = '{key}';
+        END
+    """)
+
+
+def _set_file_format(conn: sqlite3.Connection):
+    """Apply file-level settings: page size and auto-vacuum (new files only), WAL."""
+    if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+        # Both are fixed once the first table exists, so only a new file
+        # can take them. Incremental auto-vacuum lets clear_legacy_trades()
+        # give space back without a full VACUUM.
+        conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    # WAL lets readers run alongside the writer and batches fsyncs.
+    # journal_mode can't change inside a transaction.
+    conn.execute("PRAGMA journal_mode=WAL")
+
+
+_KALSHI_ROW_KEYS = ("market_ticker", "yes_price", "no_price", "market_result")
+_kalshi_row_fields = operator.itemgetter(*_KALSHI_ROW_KEYS)
+
+
+def _flatten(rows_by_ts: Dict[int, List[Dict]], now: int) -> Iterator[tuple]:
+    """Yield kalshi_trades_v2/kalshi_candles rows from a timestamp-keyed dict."""
+    for ts, row_list in rows_by_ts.items():
+        for row in row_list:
+            try:
+                fields = _kalshi_row_fields(row)
+            except KeyError:
+                # Producers normally include every key; tolerate partial rows
+                fields = tuple(row.get(key) for key in _KALSHI_ROW_KEYS)
+            yield (ts, *fields, now)
+
 
 class DataCache:
     """SQLite-based cache for historical market data."""
 
+    # Database files whose schema has already been set up in this process
+    _initialized_paths: set = set()
+
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived writer shared across threads (serialized by the lock)
+        # and one read-only connection per thread, opened on first use.
+        # Reentrant so a partition can stay attached across _write_rows()
+        self._write_lock = threading.RLock()
+        self._write_conn = self._connect(isolation_level=None, check_same_thread=False)
+        # Don't checkpoint in the middle of a large batch
+        self._write_conn.execute("PRAGMA wal_autocheckpoint=10000")
+        self._read_local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._closed = False
         self._init_db()
 
+        # save_* hand their rows to a single writer thread and return; a
+        # failed write is kept and re-raised by the next flush() or save_*
+        self._write_queue: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._write_error: Optional[Exception] = None
+        self._writer_thread = threading.Thread(
+            target=self._drain, name="cache-writer", daemon=True
+        )
+        self._writer_thread.start()
+        # The writer is a daemon thread, so queued rows are only written at
+        # exit if close() runs
+        atexit.register(self.close)
+
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Open a connection with the cache's PRAGMA tuning applied."""
+        conn = sqlite3.connect(self.db_path, cached_statements=256, **kwargs)
+        conn.executescript(CONNECTION_PRAGMAS)
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection, once queued saves have landed."""
+        self.flush()
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            conn = self._open_reader()
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the current thread."""
+        conn = self._connect(isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA query_only=1")
+        self._read_local.conn = conn
+        with self._write_lock:
+            self._readers.append(conn)
+        return conn
+
+    def close(self):
+        """Finish queued saves, refresh planner statistics and close all connections."""
+        if self._closed:
+            return
+        atexit.unregister(self.close)
+        try:
+            self.flush()
+        finally:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            with self._write_lock:
+                if not self._closed:
+                    self._closed = True
+                    for conn in self._readers:
+                        conn.close()
+                    self._readers.clear()
+                    self._write_conn.execute("PRAGMA optimize")
+                    self._write_conn.close()
+            self._read_local = threading.local()
+
+    def flush(self):
+        """Block until every queued save has been written.
+
+        Raises the error of a queued save that failed since the last check.
+        """
+        if threading.current_thread() is not self._writer_thread:
+            self._write_queue.join()
+            self._raise_write_error()
+
+    def _raise_write_error(self):
+        """Re-raise (once) an exception the writer thread hit."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _enqueue(self, sql: str, rows: List[tuple], partition: Optional[str] = None):
+        """Queue rows for the writer thread; blocks while the queue is full."""
+        self._raise_write_error()
+        self._write_queue.put((sql, partition, rows))
+
+    def _drain(self):
+        """Writer thread: apply queued saves, merging those that arrive together.
+
+        After taking a save it waits up to WRITE_COALESCE_SECONDS for more;
+        consecutive saves with the same statement and partition are written
+        as one batch, so a burst of small saves costs one commit.
+        """
+        while True:
+            items = [self._write_queue.get()]
+            deadline = time.monotonic() + WRITE_COALESCE_SECONDS
+            while items[-1] is not None and (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    items.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            pending = [item for item in items if item is not None]
+            i = 0
+            while i < len(pending):
+                sql, partition, rows = pending[i]
+                j = i + 1
+                while j < len(pending) and pending[j][:2] == (sql, partition):
+                    rows = rows + pending[j][2]
+                    j += 1
+                try:
+                    self._apply(sql, partition, rows)
+                except Exception as e:
+                    logger.exception(f"Failed to write {len(rows)} cached rows")
+                    self._write_error = e
+                i = j
+
+            for _ in items:
+                self._write_queue.task_done()
+            if items[-1] is None:
+                return
+
+    def _apply(self, sql: str, partition: Optional[str], rows: List[tuple]):
+        """Write one queued batch, attaching its kline partition if it has one."""
+        if partition is None:
+            self._write_rows(sql, rows)
+            return
+        self._init_partition(partition)
+        with self._write_lock, self._attached(self._write_conn, partition):
+            self._write_rows(sql, rows)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block on the writer inside BEGIN IMMEDIATE ... COMMIT."""
+        with self._write_lock:
+            conn = self._write_conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _write_rows(self, sql: str, rows: Iterable[tuple]) -> int:
+        """executemany() rows in explicit transactions of WRITE_BATCH_ROWS."""
+        total = 0
+        it = iter(rows)
+        while batch := list(islice(it, WRITE_BATCH_ROWS)):
+            with self._transaction() as conn:
+                conn.executemany(sql, batch)
+            total += len(batch)
+
+        if total > OPTIMIZE_AFTER_ROWS:
+            # 0x10002: ANALYZE any table whose stats look stale, checking all
+            # tables rather than only those this connection has queried
+            with self._write_lock:
+                self._write_conn.execute("PRAGMA optimize=0x10002")
+        return total
+
     def _init_db(self):
         """Initialize database tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS kalshi_trades_v2 (
-                    timestamp INTEGER,
-                    ticker TEXT,
-                    yes_price REAL,
-                    no_price REAL,
-                    market_result TEXT,
-                    fetched_at TEXT,
-                    PRIMARY KEY (timestamp, ticker)
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS kalshi_candles (
-                    timestamp INTEGER,
-                    ticker TEXT,
-                    yes_price REAL,
-                    no_price REAL,
-                    market_result TEXT,
-                    fetched_at TEXT,
-                    PRIMARY KEY (timestamp, ticker)
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS kalshi_candles (
-                    timestamp INTEGER,
-                    ticker TEXT,
-                    yes_price REAL,
-                    no_price REAL,
-                    market_result TEXT,
-                    fetched_at TEXT,
-                    PRIMARY KEY (timestamp, ticker)
-                )
-            """)
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS binance_klines (
-                    symbol TEXT,
-                    timestamp INTEGER,
-                    open REAL,
-                    high REAL,
-                    low REAL,
-                    close REAL,
-                    volume REAL,
-                    fetched_at TEXT,
-                    PRIMARY KEY (symbol, timestamp)
-                )
-            """)
+        key = self.db_path.resolve()
+        if key in DataCache._initialized_paths:
+            return
+
+        with self._write_lock:
+            _set_file_format(self._write_conn)
+        with self._transaction() as conn:
+            for table, columns in TABLE_COLUMNS.items():
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+                self._migrate_fetched_at(conn, table, columns)
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_meta (
                     key TEXT PRIMARY KEY,
                     value TEXT
                 )
             """)
+            # Covering indexes for the ticker + time-range reads; the
+            # (timestamp, ticker) primary keys already serve MAX(timestamp),
+            # so the old timestamp-only indexes are redundant.
+            conn.execute("DROP INDEX IF EXISTS idx_kalshi_ts")
+            conn.execute("DROP INDEX IF EXISTS idx_kalshi_candles_ts")
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_kalshi_ts ON kalshi_trades_v2(timestamp)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_kalshi_candles_ts ON kalshi_candles(timestamp)"
+                "CREATE INDEX IF NOT EXISTS idx_kalshi_ticker_ts ON kalshi_trades_v2"
+                "(ticker, timestamp, yes_price, no_price, market_result)"
             )
             conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_binance_ts ON binance_klines(symbol, timestamp)"
+                "CREATE INDEX IF NOT EXISTS idx_kalshi_candles_ticker_ts ON kalshi_candles"
+                "(ticker, timestamp, yes_price, no_price, market_result)"
             )
-            conn.commit()
+            # Same columns as the (symbol, timestamp) primary key
+            conn.execute("DROP INDEX IF EXISTS idx_binance_ts")
+            _install_row_counter(conn, "kalshi_trades_v2")
+            _install_row_counter(conn, "kalshi_candles")
+            # Seed sqlite_stat1 so the planner has statistics from the start
+            has_stats = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if not has_stats:
+                conn.execute("ANALYZE")
+
+        self._move_klines_to_partitions()
+        # Give partitions from older versions their row counter
+        for partition in self._partition_keys():
+            self._init_partition(partition)
+        DataCache._initialized_paths.add(key)
+
+    @staticmethod
+    def _migrate_fetched_at(conn: sqlite3.Connection, table: str, columns: str):
+        """Rebuild a table whose fetched_at column still has TEXT affinity.
+
+        Integers written into a TEXT column are stored as text, so the column
+        type has to change too; SQLite can't alter it in place. Old ISO-8601
+        values were local time and are converted to unix seconds.
+        """
+        declared = {
+            name: col_type
+            for _, name, col_type, *_ in conn.execute(f"PRAGMA table_info({table})")
+        }
+        if declared.get("fetched_at", "").upper() != "TEXT":
+            return
+
+        names = [name for name in declared if name != "fetched_at"]
+        column_list = ", ".join(names)
+        conn.execute(f"CREATE TABLE {table}_migrated ({columns})")
+        conn.execute(f"""
+            INSERT INTO {table}_migrated ({column_list}, fetched_at)
+            SELECT {column_list}, CAST(strftime('%s', fetched_at, 'utc') AS INTEGER)
+            FROM {table}
+        """)
+        # Dropping the old table drops its indexes; _init_db recreates them
+        conn.execute(f"DROP TABLE {table}")
+        conn.execute(f"ALTER TABLE {table}_migrated RENAME TO {table}")
+        logger.info(f"Migrated {table}.fetched_at to unix seconds")
 
     # === Kalshi Trades ===
 
@@ -101,69 +475,49 @@ class DataCache:
         if not tickers:
             return {}
 
-        result = {}
-        batch_size = 900  # SQLite variable limit safety
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            for i in range(0, len(tickers), batch_size):
-                batch = tickers[i : i + batch_size]
-                placeholders = ",".join("?" for _ in batch)
-                query = f"""
-                    SELECT timestamp, ticker, yes_price, no_price, market_result
-                    FROM kalshi_trades_v2
-                    WHERE ticker IN ({placeholders}) AND timestamp BETWEEN ? AND ?
-                """
-                params = list(batch) + [start_ts, end_ts]
-
-                rows = conn.execute(query, params).fetchall()
-                for row in rows:
-                    ts = row["timestamp"]
-                    if ts not in result:
-                        result[ts] = []
-                    result[ts].append(
-                        {
-                            "yes_price": row["yes_price"],
-                            "no_price": row["no_price"],
-                            "market_ticker": row["ticker"],
-                            "market_result": row["market_result"],
-                        }
-                    )
-        return result
+        result = defaultdict(list)
+
+        # Iterate the cursor directly so rows are grouped as SQLite produces them
+        cur = self._reader().execute(
+            _ticker_range_sql("kalshi_trades_v2"), (json.dumps(list(tickers)), start_ts, end_ts)
+        )
+        for ts, ticker, yes_price, no_price, market_result in cur:
+            result[ts].append(
+                {
+                    "yes_price": yes_price,
+                    "no_price": no_price,
+                    "market_ticker": ticker,
+                    "market_result": market_result,
+                }
+            )
+        return dict(result)
 
     def save_kalshi_trades(self, trades_by_ts: Dict[int, List[Dict]]):
         """Save Kalshi trades to cache."""
         if not trades_by_ts:
             return
 
-        now = datetime.now().isoformat()
-        flat_trades = []
-        for ts, trade_list in trades_by_ts.items():
-            for trade in trade_list:
-                flat_trades.append(
-                    (
-                        ts,
-                        trade.get("market_ticker"),
-                        trade.get("yes_price"),
-                        trade.get("no_price"),
-                        trade.get("market_result"),
-                        now,
-                    )
-                )
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO kalshi_trades_v2
-                (timestamp, ticker, yes_price, no_price, market_result, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                flat_trades,
-            )
-            conn.commit()
-
-        logger.info(f"Cached {len(flat_trades)} Kalshi trades")
+        now = int(time.time())
+        rows = list(_flatten(trades_by_ts, now))
+        # Upsert: update conflicting rows in place and skip unchanged ones
+        self._enqueue(
+            """
+            INSERT INTO kalshi_trades_v2
+            (timestamp, ticker, yes_price, no_price, market_result, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (timestamp, ticker) DO UPDATE SET
+                yes_price = excluded.yes_price,
+                no_price = excluded.no_price,
+                market_result = excluded.market_result,
+                fetched_at = excluded.fetched_at
+            WHERE kalshi_trades_v2.yes_price IS NOT excluded.yes_price
+               OR kalshi_trades_v2.no_price IS NOT excluded.no_price
+               OR kalshi_trades_v2.market_result IS NOT excluded.market_result
+        """,
+            rows,
+        )
+
+        logger.info(f"Queued {len(rows)} Kalshi trades for the cache")
 
     # === Kalshi Candles ===
 
@@ -174,203 +528,402 @@ class DataCache:
         if not tickers:
             return {}
 
-        result = {}
-        batch_size = 900  # SQLite variable limit safety
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            for i in range(0, len(tickers), batch_size):
-                batch = tickers[i : i + batch_size]
-                placeholders = ",".join("?" for _ in batch)
-                query = f"""
-                    SELECT timestamp, ticker, yes_price, no_price, market_result
-                    FROM kalshi_candles
-                    WHERE ticker IN ({placeholders}) AND timestamp BETWEEN ? AND ?
-                """
-                params = list(batch) + [start_ts, end_ts]
-
-                rows = conn.execute(query, params).fetchall()
-                for row in rows:
-                    ts = row["timestamp"]
-                    if ts not in result:
-                        result[ts] = []
-                    result[ts].append(
-                        {
-                            "yes_price": row["yes_price"],
-                            "no_price": row["no_price"],
-                            "market_ticker": row["ticker"],
-                            "market_result": row["market_result"],
-                        }
-                    )
-        return result
+        result = defaultdict(list)
+
+        # Iterate the cursor directly so rows are grouped as SQLite produces them
+        cur = self._reader().execute(
+            _ticker_range_sql("kalshi_candles"), (json.dumps(list(tickers)), start_ts, end_ts)
+        )
+        for ts, ticker, yes_price, no_price, market_result in cur:
+            result[ts].append(
+                {
+                    "yes_price": yes_price,
+                    "no_price": no_price,
+                    "market_ticker": ticker,
+                    "market_result": market_result,
+                }
+            )
+        return dict(result)
 
     def save_kalshi_candles(self, candles_by_ts: Dict[int, List[Dict]]):
         """Save Kalshi candles to cache."""
         if not candles_by_ts:
             return
 
-        now = datetime.now().isoformat()
-        flat_candles = []
-        for ts, candle_list in candles_by_ts.items():
-            for candle in candle_list:
-                flat_candles.append(
-                    (
-                        ts,
-                        candle.get("market_ticker"),
-                        candle.get("yes_price"),
-                        candle.get("no_price"),
-                        candle.get("market_result"),
-                        now,
-                    )
-                )
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO kalshi_candles
-                (timestamp, ticker, yes_price, no_price, market_result, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                flat_candles,
-            )
-            conn.commit()
-
-        logger.info(f"Cached {len(flat_candles)} Kalshi candles")
+        now = int(time.time())
+        rows = list(_flatten(candles_by_ts, now))
+        self._enqueue(
+            """
+            INSERT INTO kalshi_candles
+            (timestamp, ticker, yes_price, no_price, market_result, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (timestamp, ticker) DO UPDATE SET
+                yes_price = excluded.yes_price,
+                no_price = excluded.no_price,
+                market_result = excluded.market_result,
+                fetched_at = excluded.fetched_at
+            WHERE kalshi_candles.yes_price IS NOT excluded.yes_price
+               OR kalshi_candles.no_price IS NOT excluded.no_price
+               OR kalshi_candles.market_result IS NOT excluded.market_result
+        """,
+            rows,
+        )
+
+        logger.info(f"Queued {len(rows)} Kalshi candles for the cache")
 
     def get_kalshi_latest_ts(self) -> Optional[int]:
         """Get the latest cached Kalshi timestamp."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute("SELECT MAX(timestamp) FROM kalshi_trades_v2").fetchone()
-            return row[0] if row and row[0] else None
+        conn = self._reader()
+        row = conn.execute("SELECT MAX(timestamp) FROM kalshi_trades_v2").fetchone()
+        return row[0] if row and row[0] else None
 
     # === Binance Klines ===
 
     def get_binance_klines(self, symbol: str, start_ts: int, end_ts: int) -> List[List]:
         """Get cached Binance klines in time range."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
-                """
-                SELECT timestamp, open, high, low, close, volume
-                FROM binance_klines
-                WHERE symbol = ? AND timestamp BETWEEN ? AND ?
-                ORDER BY timestamp
-            """,
-                (symbol, start_ts, end_ts),
-            ).fetchall()
+        arr = self.get_binance_klines_array(symbol, start_ts, end_ts)
 
         # Return in Binance kline format: [open_time, open, high, low, close, volume, close_time, ...]
         return [
-            [
-                row["timestamp"],
-                row["open"],
-                row["high"],
-                row["low"],
-                row["close"],
-                row["volume"],
-                row["timestamp"] + 60000,
-            ]
-            for row in rows
+            [ts, o, h, l, c, v, ts + 60000]
+            for ts, o, h, l, c, v in arr.tolist()
         ]
 
+    def get_binance_klines_array(self, symbol: str, start_ts: int, end_ts: int) -> np.ndarray:
+        """Get cached Binance klines in time range as a KLINE_DTYPE structured array."""
+        conn = self._reader()
+        parts = []
+        for key in self._partition_keys(start_ts, end_ts):
+            with self._attached(conn, key) as schema:
+                # No ORDER BY: partitions only have the (symbol, timestamp)
+                # primary key, and the plan is a range search on it
+                # (SEARCH ... USING INDEX sqlite_autoindex_binance_klines_1),
+                # so rows already come back in timestamp order
+                cur = conn.execute(
+                    f"""
+                    SELECT timestamp, open, high, low, close, volume
+                    FROM {schema}.binance_klines
+                    WHERE symbol = ? AND timestamp BETWEEN ? AND ?
+                """,
+                    (symbol, start_ts, end_ts),
+                )
+                parts.append(np.fromiter(cur, dtype=KLINE_DTYPE))
+
+        # Partitions are visited oldest first, so concatenating keeps the
+        # result in timestamp order
+        if not parts:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        return np.concatenate(parts)
+
     def save_binance_klines(self, symbol: str, klines: List[List]):
-        """Save Binance klines to cache."""
+        """Save Binance klines to cache, split across monthly partitions."""
         if not klines:
             return
 
-        now = datetime.now().isoformat()
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executemany(
-                """
-                INSERT OR REPLACE INTO binance_klines
-                (symbol, timestamp, open, high, low, close, volume, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                [
-                    (
-                        symbol,
-                        int(k[0]),
-                        float(k[1]),
-                        float(k[2]),
-                        float(k[3]),
-                        float(k[4]),
-                        float(k[5]),
-                        now,
-                    )
-                    for k in klines
-                ],
+        now = int(time.time())
+        rows_by_partition = defaultdict(list)
+        for k in klines:
+            ts = int(k[0])
+            rows_by_partition[_partition_for(ts)].append(
+                (
+                    symbol,
+                    ts,
+                    float(k[1]),
+                    float(k[2]),
+                    float(k[3]),
+                    float(k[4]),
+                    float(k[5]),
+                    now,
+                )
             )
-            conn.commit()
 
-        logger.info(f"Cached {len(klines)} Binance klines for {symbol}")
+        for key, rows in rows_by_partition.items():
+            self._enqueue(_kline_upsert_sql(_partition_schema(key)), rows, partition=key)
+
+        logger.info(f"Queued {len(klines)} Binance klines for {symbol} for the cache")
 
     def get_binance_latest_ts(self, symbol: str) -> Optional[int]:
         """Get the latest cached Binance timestamp for a symbol."""
-        with sqlite3.connect(self.db_path) as conn:
-            row = conn.execute(
-                "SELECT MAX(timestamp) FROM binance_klines WHERE symbol = ?", (symbol,)
-            ).fetchone()
-            return row[0] if row and row[0] else None
+        return self.get_binance_latest_ts_batch([symbol]).get(symbol)
+
+    def get_binance_latest_ts_batch(self, symbols: List[str]) -> Dict[str, int]:
+        """Get the latest cached Binance timestamp for several symbols at once.
+
+        Symbols with no cached klines are omitted from the result.
+        """
+        result = {}
+        remaining = list(symbols)
+        conn = self._reader()
+        # Walk partitions newest first; most symbols resolve in the first one
+        for key in reversed(self._partition_keys()):
+            if not remaining:
+                break
+            with self._attached(conn, key) as schema:
+                # A correlated MAX per symbol is a single descent of the
+                # (symbol, timestamp) primary key, unlike GROUP BY which scans rows
+                cur = conn.execute(
+                    f"""
+                    SELECT value,
+                           (SELECT MAX(timestamp) FROM {schema}.binance_klines
+                            WHERE symbol = value)
+                    FROM json_each(?)
+                """,
+                    (json.dumps(remaining),),
+                )
+                result.update((symbol, ts) for symbol, ts in cur if ts)
+            remaining = [symbol for symbol in remaining if symbol not in result]
+        return result
+
+    # === Binance kline partitions ===
+
+    def _partition_path(self, key: str) -> Path:
+        """File holding one month of klines, e.g. cache_2024_10.db."""
+        return self.db_path.with_name(f"{self.db_path.stem}_{key}.db")
+
+    def _partition_keys(
+        self, start_ts: Optional[int] = None, end_ts: Optional[int] = None
+    ) -> List[str]:
+        """Keys of existing partitions, oldest first, optionally limited to a range."""
+        prefix = f"{self.db_path.stem}_"
+        keys = sorted(
+            path.stem[len(prefix):]
+            for path in self.db_path.parent.glob(f"{prefix}[0-9][0-9][0-9][0-9]_[0-9][0-9].db")
+        )
+        if start_ts is not None:
+            first = _partition_for(start_ts)
+            keys = [key for key in keys if key >= first]
+        if end_ts is not None:
+            last = _partition_for(end_ts)
+            keys = [key for key in keys if key <= last]
+        return keys
+
+    def _init_partition(self, key: str):
+        """Create a partition file with the binance_klines table if needed."""
+        path = self._partition_path(key)
+        resolved = path.resolve()
+        if resolved in DataCache._initialized_paths:
+            return
+
+        conn = sqlite3.connect(path, isolation_level=None)
+        try:
+            _set_file_format(conn)
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS binance_klines ({TABLE_COLUMNS['binance_klines']})"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            _install_row_counter(conn, "binance_klines")
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        DataCache._initialized_paths.add(resolved)
+
+    @contextmanager
+    def _attached(self, conn: sqlite3.Connection, key: str) -> Iterator[str]:
+        """ATTACH a partition to conn for the block and yield its schema name.
+
+        Partitions are attached per call rather than kept open: SQLite caps
+        attached databases at 10 per connection, and cold months then stay
+        out of the page cache.
+        """
+        schema = _partition_schema(key)
+        conn.execute(f"ATTACH DATABASE ? AS {schema}", (str(self._partition_path(key)),))
+        try:
+            yield schema
+        finally:
+            conn.execute(f"DETACH DATABASE {schema}")
+
+    def _move_klines_to_partitions(self):
+        """Move klines left in the main file by older versions into partitions."""
+        conn = self._write_conn
+        with self._write_lock:
+            keys = [
+                key
+                for (key,) in conn.execute(
+                    "SELECT DISTINCT strftime('%Y_%m', timestamp / 1000, 'unixepoch')"
+                    " FROM binance_klines"
+                )
+            ]
+            for key in keys:
+                start, end = _partition_bounds(key)
+                self._init_partition(key)
+                with self._attached(conn, key) as schema, self._transaction():
+                    conn.execute(
+                        f"""
+                        INSERT OR IGNORE INTO {schema}.binance_klines
+                        SELECT * FROM main.binance_klines
+                        WHERE timestamp >= ? AND timestamp < ?
+                    """,
+                        (start, end),
+                    )
+                    conn.execute(
+                        "DELETE FROM main.binance_klines WHERE timestamp >= ? AND timestamp < ?",
+                        (start, end),
+                    )
+                logger.info(f"Moved cached Binance klines for {key} into {schema}")
 
     # === Utilities ===
 
+    def _row_counts(self, tables: List[str], schema: str = "main") -> Dict[str, int]:
+        """Read row counts from the trigger-maintained counters in cache_meta.
+
+        Tables without a counter (a file this version hasn't set up yet)
+        fall back to an exact COUNT(*).
+        """
+        conn = self._reader()
+        try:
+            counts = {
+                key[len("row_count:"):]: int(value)
+                for key, value in conn.execute(
+                    f"""
+                    SELECT key, value FROM {schema}.cache_meta
+                    WHERE key IN ({",".join("?" * len(tables))})
+                """,
+                    [f"row_count:{table}" for table in tables],
+                )
+            }
+        except sqlite3.OperationalError:
+            counts = {}
+
+        for table in tables:
+            if table not in counts:
+                counts[table] = conn.execute(
+                    f"SELECT COUNT(*) FROM {schema}.{table}"
+                ).fetchone()[0]
+        return counts
+
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        with sqlite3.connect(self.db_path) as conn:
-            kalshi_count = conn.execute(
-                "SELECT COUNT(*) FROM kalshi_trades_v2"
-            ).fetchone()[0]
-            try:
-                kalshi_candles_count = conn.execute(
-                    "SELECT COUNT(*) FROM kalshi_candles"
-                ).fetchone()[0]
-            except sqlite3.OperationalError:
-                kalshi_candles_count = 0
-            binance_count = conn.execute(
-                "SELECT COUNT(*) FROM binance_klines"
-            ).fetchone()[0]
-            kalshi_range = conn.execute(
-                "SELECT MIN(timestamp), MAX(timestamp) FROM kalshi_trades_v2"
-            ).fetchone()
-            binance_range = conn.execute(
-                "SELECT MIN(timestamp), MAX(timestamp) FROM binance_klines"
-            ).fetchone()
+        conn = self._reader()
+        counts = self._row_counts(["kalshi_trades_v2", "kalshi_candles"])
+        kalshi_range = conn.execute(
+            "SELECT MIN(timestamp), MAX(timestamp) FROM kalshi_trades_v2"
+        ).fetchone()
+
+        counts["binance_klines"] = 0
+        binance_min = binance_max = None
+        partitions = self._partition_keys()
+        for key in partitions:
+            with self._attached(conn, key) as schema:
+                counts["binance_klines"] += self._row_counts(
+                    ["binance_klines"], schema
+                )["binance_klines"]
+                if key in (partitions[0], partitions[-1]):
+                    lo, hi = conn.execute(
+                        f"SELECT MIN(timestamp), MAX(timestamp) FROM {schema}.binance_klines"
+                    ).fetchone()
+                    binance_min = lo if binance_min is None else binance_min
+                    binance_max = hi if hi is not None else binance_max
+        binance_range = (binance_min, binance_max)
 
         return {
-            "kalshi_trades": kalshi_count,
-            "kalshi_candles": kalshi_candles_count,
-            "binance_klines": binance_count,
+            "kalshi_trades": counts["kalshi_trades_v2"],
+            "kalshi_candles": counts["kalshi_candles"],
+            "binance_klines": counts["binance_klines"],
             "kalshi_range": kalshi_range,
             "binance_range": binance_range,
-            "db_size_mb": round(self.db_path.stat().st_size / 1024 / 1024, 2)
-            if self.db_path.exists()
-            else 0,
+            "db_size_mb": round(self._db_size_bytes() / 1024 / 1024, 2),
         }
 
+    def _db_size_bytes(self) -> int:
+        """Size of the main and partition files plus their WALs (recent writes)."""
+        total = 0
+        files = [self.db_path] + [self._partition_path(key) for key in self._partition_keys()]
+        for db_file in files:
+            for path in (db_file, db_file.with_name(db_file.name + "-wal")):
+                if path.exists():
+                    total += path.stat().st_size
+        return total
+
+    def verify(self, deep: bool = False, force: bool = False) -> bool:
+        """Check the cache file for corruption.
+
+        Uses PRAGMA quick_check, which catches file-format corruption without
+        cross-checking every index against its table. deep=True runs the full
+        (O(file size)) integrity_check instead. Unless forced, the check is
+        skipped for an empty file or if one passed within the last 24h.
+        """
+        if self.db_path.stat().st_size == 0:
+            return True
+
+        now = int(time.time())
+        conn = self._reader()
+        if not force:
+            row = conn.execute(
+                "SELECT value FROM cache_meta WHERE key = 'last_integrity_check'"
+            ).fetchone()
+            if row and now - int(row[0]) < INTEGRITY_CHECK_INTERVAL_SECONDS:
+                return True
+
+        pragma = "integrity_check" if deep else "quick_check"
+        problems = [r[0] for r in conn.execute(f"PRAGMA {pragma}")]
+        if problems != ["ok"]:
+            logger.error(f"Cache {pragma} failed: {problems[:5]}")
+            return False
+
+        with self._transaction() as wconn:
+            wconn.execute(
+                "INSERT OR REPLACE INTO cache_meta (key, value) VALUES ('last_integrity_check', ?)",
+                (str(now),),
+            )
+        return True
+
     def clear(self):
         """Clear all cached data."""
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush()
+        with self._transaction() as conn:
             conn.execute("DELETE FROM kalshi_trades_v2")
             conn.execute("DELETE FROM kalshi_candles")
             conn.execute("DELETE FROM binance_klines")
-            conn.execute("DELETE FROM cache_meta")
-            conn.commit()
+            # The row counters were zeroed by the delete triggers; keep them
+            conn.execute("DELETE FROM cache_meta WHERE key NOT LIKE 'row_count:%'")
+            for key in self._partition_keys():
+                path = self._partition_path(key)
+                for suffix in ("", "-wal", "-shm"):
+                    path.with_name(path.name + suffix).unlink(missing_ok=True)
+                DataCache._initialized_paths.discard(path.resolve())
         logger.info("Cache cleared")
 
+    def _reclaim_free_pages(self):
+        """Return free pages to the OS.
+
+        Files created with auto_vacuum=INCREMENTAL are truncated in bounded
+        steps, releasing the write lock between them. Older files get one
+        full VACUUM, which also switches them to incremental auto-vacuum.
+        """
+        conn = self._write_conn
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # VACUUM can't run inside a transaction
+            with self._write_lock:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+            return
+
+        while conn.execute("PRAGMA freelist_count").fetchone()[0] > 0:
+            with self._write_lock:
+                # executescript steps the pragma to completion; execute()
+                # stops after the first page
+                conn.executescript(
+                    f"PRAGMA incremental_vacuum({INCREMENTAL_VACUUM_PAGES})"
+                )
+
     def clear_legacy_trades(self):
         """Clear legacy Kalshi trade data (kalshi_trades_v2) to save space."""
-        with sqlite3.connect(self.db_path) as conn:
+        self.flush()
+        with self._transaction() as conn:
             count = conn.execute("SELECT COUNT(*) FROM kalshi_trades_v2").fetchone()[0]
             if count > 0:
                 conn.execute("DELETE FROM kalshi_trades_v2")
-                conn.execute("VACUUM")  # Reclaim disk space
-                conn.commit()
-                logger.info(
-                    f"Cleared {count} legacy Kalshi trades and vacuumed database"
-                )
-            else:
-                logger.info("No legacy trades found to clear")
+
+        if count > 0:
+            self._reclaim_free_pages()
+            logger.info(
+                f"Cleared {count} legacy Kalshi trades and vacuumed database"
+            )
+        else:
+            logger.info("No legacy trades found to clear")
 
 
 # Singleton instance
@@ -10,14 +10,54 @@ Data is saved to logs/kalshi_history_{date}.jsonl
 
 import asyncio
 import json
-from datetime import datetime
+import logging
+import logging.handlers
+import os
+import queue
+from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, TypedDict
 
 import httpx
 
 import config
 
+logger = logging.getLogger(__name__)
+
+# orjson works on bytes directly and is much faster; it's optional
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# HTTP/2 needs httpx's optional h2 extra (pip install "httpx[http2]")
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class MarketRecord(TypedDict):
+    """One line of kalshi_history_{date}.jsonl."""
+
+    timestamp: str
+    ticker: str
+    series: str
+    title: str
+    yes_ask: int
+    yes_bid: int
+    no_ask: int
+    no_bid: int
+    last_price: int
+    volume: int
+    open_interest: int
+    expiration: Optional[str]
+
 
 class KalshiDataCollector:
     """Collects and stores Kalshi market data for backtesting."""
@@ -28,75 +68,174 @@ class KalshiDataCollector:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.poll_interval = 60  # seconds between polls
         self.series = config.KALSHI_CRYPTO_SERIES
+        # Query params per series never change; build them once
+        self._params = {
+            s: {"series_ticker": s, "status": "open", "limit": 100} for s in self.series
+        }
+        self._cached_date: Optional[date] = None
+        self._cached_path: Optional[Path] = None
+        # Today's output file descriptor, kept open across polls
+        self._fd: Optional[int] = None
+        self._fd_path: Optional[Path] = None
+        # Cap in-flight requests and space request starts so concurrent
+        # series fetches stay under Kalshi's read limit
+        self._semaphore = asyncio.Semaphore(config.KALSHI_READ_LIMIT_PER_SECOND)
+        self._min_request_interval = 1.0 / config.KALSHI_READ_LIMIT_PER_SECOND
+        self._next_request_time: float = 0
+        # One pooled client for the collector's lifetime; closed by aclose().
+        # With HTTP/2 the concurrent series fetches share one connection.
+        # httpx already requests gzip/deflate responses by default.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=16, max_connections=32),
+            http2=HTTP2_AVAILABLE,
+        )
+
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._client.aclose()
 
     def _get_output_file(self) -> Path:
-        """Get output file for today's date."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        return self.output_dir / f"kalshi_history_{date_str}.jsonl"
+        """Get output file for today's date (rebuilt only when the date changes)."""
+        today = date.today()
+        if today != self._cached_date:
+            self._cached_path = self.output_dir / f"kalshi_history_{today.isoformat()}.jsonl"
+            self._cached_date = today
+        return self._cached_path
+
+    def _output_fd(self) -> int:
+        """Get the append-mode descriptor for today's file, rolling over at midnight."""
+        path = self._get_output_file()
+        if path != self._fd_path:
+            self._close_output()
+            self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            self._fd_path = path
+        return self._fd
+
+    def _write_output(self, payload: bytes):
+        """Append payload to today's file, retrying short writes."""
+        fd = self._output_fd()
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _close_output(self):
+        """Close the output file, if open."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._fd_path = None
+
+    async def _rate_limit(self) -> None:
+        """Wait for the next free request slot (KALSHI_READ_LIMIT_PER_SECOND)."""
+        now = asyncio.get_running_loop().time()
+        # Reserve a slot before awaiting so concurrent callers queue up in order
+        slot = max(now, self._next_request_time)
+        self._next_request_time = slot + self._min_request_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
 
     async def fetch_markets(self, series_ticker: str) -> List[Dict[str, Any]]:
         """Fetch all open markets for a series."""
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(
-                f"{self.base_url}/markets",
-                params={"series_ticker": series_ticker, "status": "open", "limit": 100}
-            )
-            if resp.status_code == 200:
-                return resp.json().get("markets", [])
-            return []
-
-    def parse_market(self, market: Dict[str, Any], series: str) -> Dict[str, Any]:
-        """Parse market data into storage format."""
+        params = self._params.get(series_ticker) or {
+            "series_ticker": series_ticker, "status": "open", "limit": 100
+        }
+        async with self._semaphore:
+            await self._rate_limit()
+            resp = await self._client.get("/markets", params=params)
+        if resp.status_code == 200:
+            # Parse the raw body; skips httpx's decode-to-str step
+            return _loads(resp.content).get("markets", [])
+        return []
+
+    def parse_market(
+        self, market: Dict[str, Any], series: str, timestamp: Optional[str] = None
+    ) -> MarketRecord:
+        """Parse market data into storage format.
+
+        timestamp defaults to now; collect_once passes one shared value per poll.
+        """
+        get = market.get  # bound once; called for every field
         return {
-            "timestamp": datetime.now().isoformat(),
-            "ticker": market.get("ticker", ""),
+            "timestamp": timestamp or datetime.now().isoformat(),
+            "ticker": get("ticker", ""),
             "series": series,
-            "title": market.get("title", ""),
-            "yes_ask": market.get("yes_ask", 0),
-            "yes_bid": market.get("yes_bid", 0),
-            "no_ask": market.get("no_ask", 0),
-            "no_bid": market.get("no_bid", 0),
-            "last_price": market.get("last_price", 0),
-            "volume": market.get("volume", 0),
-            "open_interest": market.get("open_interest", 0),
-            "expiration": market.get("expiration_time") or market.get("close_time"),
+            "title": get("title", ""),
+            "yes_ask": get("yes_ask", 0),
+            "yes_bid": get("yes_bid", 0),
+            "no_ask": get("no_ask", 0),
+            "no_bid": get("no_bid", 0),
+            "last_price": get("last_price", 0),
+            "volume": get("volume", 0),
+            "open_interest": get("open_interest", 0),
+            "expiration": get("expiration_time") or get("close_time"),
         }
 
     async def collect_once(self) -> int:
         """Collect data once for all series. Returns count of markets saved."""
-        output_file = self._get_output_file()
         count = 0
 
-        with open(output_file, "a") as f:
-            for series in self.series:
-                try:
-                    markets = await self.fetch_markets(series)
-                    for market in markets:
-                        data = self.parse_market(market, series)
-                        f.write(json.dumps(data) + "\n")
-                        count += 1
-                except Exception as e:
-                    print(f"[Collector] Error fetching {series}: {e}")
+        # Fetch every series concurrently; a failure only drops its own series
+        results = await asyncio.gather(
+            *(self.fetch_markets(series) for series in self.series),
+            return_exceptions=True,
+        )
+        # One receive timestamp for the whole poll
+        timestamp = datetime.now().isoformat()
+
+        # Build the whole poll's output and append it with a single write
+        buf = bytearray()
+        for series, markets in zip(self.series, results):
+            if isinstance(markets, Exception):
+                logger.error(f"Error fetching {series}: {markets}")
+                continue
+            for market in markets:
+                buf += _dumps(self.parse_market(market, series, timestamp))
+                buf += b"\n"
+            count += len(markets)
+        if buf:
+            self._write_output(buf)
 
         return count
 
     async def run(self):
         """Run continuous data collection."""
-        print(f"[Collector] Starting Kalshi data collection")
-        print(f"[Collector] Series: {self.series}")
-        print(f"[Collector] Poll interval: {self.poll_interval}s")
-        print(f"[Collector] Output: {self.output_dir}")
-        print()
+        logger.info("Starting Kalshi data collection")
+        logger.info(f"Series: {self.series}")
+        logger.info(f"Poll interval: {self.poll_interval}s")
+        logger.info(f"Output: {self.output_dir}")
+
+        try:
+            while True:
+                try:
+                    count = await self.collect_once()
+                    logger.info(f"Collected {count} markets")
+                except Exception as e:
+                    logger.error(f"Error: {e}")
+
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            self._close_output()
+            await self.aclose()
+
 
-        while True:
-            try:
-                count = await self.collect_once()
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                print(f"[{timestamp}] Collected {count} markets")
-            except Exception as e:
-                print(f"[Collector] Error: {e}")
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Log through a queue so the polling loop never blocks on stdout.
 
-            await asyncio.sleep(self.poll_interval)
+    The returned listener owns the console handler; stop() it to flush.
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s [Collector] %(message)s", datefmt="%H:%M:%S")
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(
+        level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 async def main():
@@ -105,7 +244,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    listener = _setup_logging()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        print("\n[Collector] Stopped")
+        logger.info("Stopped")
+    finally:
+        listener.stop()
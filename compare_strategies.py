@@ -10,19 +10,29 @@ Usage:
     python compare_strategies.py logs/backtest_*.json
 """
 
+import heapq
 import json
-import glob
+import os
+import sys
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
-import statistics
+
+import numpy as np
+
+# orjson parses several times faster; json.loads also accepts bytes
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 
 def load_backtest_result(filepath: str) -> Dict[str, Any]:
     """Load a single backtest result"""
     try:
-        with open(filepath, "r") as f:
-            return json.load(f)
+        return _loads(Path(filepath).read_bytes())
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         return None
@@ -46,27 +56,54 @@ def extract_metrics(result: Dict[str, Any]) -> Dict[str, float]:
 
 def calculate_derived_metrics(metrics: Dict[str, float]) -> Dict[str, float]:
     """Calculate derived metrics"""
-    derived = metrics.copy()
-
-    # Profit factor
-    if metrics["losses"] > 0:
-        avg_win = metrics["total_pnl"] / metrics["wins"] if metrics["wins"] > 0 else 0
-        avg_loss = abs(metrics["total_pnl"]) / metrics["losses"]
-        if avg_loss > 0:
-            derived["profit_factor"] = avg_win / avg_loss
-    else:
-        derived["profit_factor"] = float("inf") if metrics["total_pnl"] > 0 else 0
-
-    # Risk-adjusted return (PnL / Drawdown)
-    if metrics["max_drawdown"] > 0:
-        derived["return_on_risk"] = metrics["total_pnl"] / metrics["max_drawdown"]
-    else:
-        derived["return_on_risk"] = 0
+    return calculate_derived_metrics_batch([metrics])[0]
 
-    # Trades per day (assuming ~7 day backtest)
-    derived["trades_per_day"] = metrics["trades"] / 7
 
-    return derived
+def calculate_derived_metrics_batch(
+    metrics_list: List[Dict[str, float]],
+) -> List[Dict[str, float]]:
+    """Calculate derived metrics for many results at once, one array per metric"""
+    if not metrics_list:
+        return []
+
+    def column(key: str) -> np.ndarray:
+        return np.fromiter(
+            (m[key] for m in metrics_list), dtype=np.float64, count=len(metrics_list)
+        )
+
+    wins, losses = column("wins"), column("losses")
+    pnl, drawdown, trades = column("total_pnl"), column("max_drawdown"), column("trades")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Profit factor
+        avg_win = np.where(wins > 0, pnl / wins, 0.0)
+        avg_loss = np.where(losses > 0, np.abs(pnl) / losses, 0.0)
+        profit_factor = np.where(
+            losses > 0,
+            np.where(avg_loss > 0, avg_win / avg_loss, 0.0),
+            np.where(pnl > 0, np.inf, 0.0),
+        )
+
+        # Risk-adjusted return (PnL / Drawdown)
+        return_on_risk = np.where(drawdown > 0, pnl / drawdown, 0.0)
+
+    # Trades per day (assuming ~7 day backtest)
+    trades_per_day = trades / 7
+
+    return [
+        {
+            **metrics,
+            "profit_factor": pf,
+            "return_on_risk": ror,
+            "trades_per_day": tpd,
+        }
+        for metrics, pf, ror, tpd in zip(
+            metrics_list,
+            profit_factor.tolist(),
+            return_on_risk.tolist(),
+            trades_per_day.tolist(),
+        )
+    ]
 
 
 def print_comparison(results: List[tuple[str, Dict[str, float]]]):
@@ -75,31 +112,29 @@ def print_comparison(results: List[tuple[str, Dict[str, float]]]):
         print("No results to compare")
         return
 
-    print("\n" + "=" * 120)
-    print("STRATEGY COMPARISON RESULTS")
-    print("=" * 120)
-
-    # Header
-    print(
-        f"{'Backtest':<40} {'Win%':>8} {'PnL':>10} {'Drawdown':>10} {'RoR':>8} {'PF':>6} {'Trades':>8}"
-    )
-    print("-" * 120)
+    # Sort by return on risk, looked up once per row and reused below
+    ranked = [(metrics.get("return_on_risk", 0), name, metrics) for name, metrics in results]
+    ranked.sort(key=itemgetter(0), reverse=True)
 
-    # Sort by return on risk
-    sorted_results = sorted(
-        results, key=lambda x: x[1].get("return_on_risk", 0), reverse=True
-    )
+    best_ror = ranked[0][0] if ranked else 0
 
-    best_ror = sorted_results[0][1].get("return_on_risk", 0) if sorted_results else 0
+    # Build the whole table and write it once
+    lines = [
+        "",
+        "=" * 120,
+        "STRATEGY COMPARISON RESULTS",
+        "=" * 120,
+        f"{'Backtest':<40} {'Win%':>8} {'PnL':>10} {'Drawdown':>10} {'RoR':>8} {'PF':>6} {'Trades':>8}",
+        "-" * 120,
+    ]
 
-    for name, metrics in sorted_results:
-        ror = metrics.get("return_on_risk", 0)
+    for ror, name, metrics in ranked:
         ror_marker = " ⭐" if ror == best_ror else ""
 
         # Truncate name for display
         display_name = name[-39:] if len(name) > 39 else name
 
-        print(
+        lines.append(
             f"{display_name:<40} "
             f"{metrics['win_rate']:>7.1f}% "
             f"${metrics['total_pnl']:>8.2f} "
@@ -109,40 +144,57 @@ def print_comparison(results: List[tuple[str, Dict[str, float]]]):
             f"{metrics['trades']:>7.0f}{ror_marker}"
         )
 
-    print("=" * 120)
-    print("\nMetrics explained:")
-    print("  Win%: Percentage of winning trades")
-    print("  PnL: Total profit/loss")
-    print("  Drawdown: Maximum peak-to-trough decline")
-    print("  RoR: Return on Risk (PnL / Drawdown) - Higher is better")
-    print("  PF: Profit Factor (Avg Win / Avg Loss) - >1.5 is good")
-    print("  Trades: Number of trades taken")
-    print("\n⭐ = Best Return on Risk (most efficient strategy)")
+    lines += [
+        "=" * 120,
+        "",
+        "Metrics explained:",
+        "  Win%: Percentage of winning trades",
+        "  PnL: Total profit/loss",
+        "  Drawdown: Maximum peak-to-trough decline",
+        "  RoR: Return on Risk (PnL / Drawdown) - Higher is better",
+        "  PF: Profit Factor (Avg Win / Avg Loss) - >1.5 is good",
+        "  Trades: Number of trades taken",
+        "",
+        "⭐ = Best Return on Risk (most efficient strategy)",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     # Find all recent backtest results
-    backtest_files = sorted(
-        glob.glob("logs/backtest_real_BTCUSDT_*.json"), key=lambda x: x, reverse=True
-    )
-
-    if not backtest_files:
+    try:
+        with os.scandir("logs") as entries:
+            backtest_names = [
+                e.name
+                for e in entries
+                if e.name.startswith("backtest_real_BTCUSDT_") and e.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        backtest_names = []
+
+    if not backtest_names:
         print("No backtest results found in logs/")
         return
 
-    print(f"Found {len(backtest_files)} backtest results")
+    print(f"Found {len(backtest_names)} backtest results")
 
-    results = []
-    for filepath in backtest_files[:10]:  # Compare last 10
-        result = load_backtest_result(filepath)
+    # Compare last 10 (names end in a sortable timestamp); pick them without
+    # sorting every file, and load them concurrently since reading dominates
+    recent_files = [f"logs/{name}" for name in heapq.nlargest(10, backtest_names)]
+    with ThreadPoolExecutor(max_workers=len(recent_files)) as ex:
+        loaded = list(ex.map(load_backtest_result, recent_files))
+
+    names = []
+    raw_metrics = []
+    for filepath, result in zip(recent_files, loaded):
         if result:
             metrics = extract_metrics(result)
             if metrics:
-                derived = calculate_derived_metrics(metrics)
-
                 # Extract timestamp from filename
-                filename = Path(filepath).stem
-                results.append((filename, derived))
+                names.append(Path(filepath).stem)
+                raw_metrics.append(metrics)
+
+    results = list(zip(names, calculate_derived_metrics_batch(raw_metrics)))
 
     print_comparison(results)
 
@@ -152,24 +204,27 @@ def main():
         print("SUMMARY STATISTICS")
         print("=" * 120)
 
-        win_rates = [m[1]["win_rate"] for m in results]
-        pnls = [m[1]["total_pnl"] for m in results]
-        rors = [m[1]["return_on_risk"] for m in results]
+        # Columns: win rate, total PnL, return on risk
+        arr = np.array(
+            [(m["win_rate"], m["total_pnl"], m["return_on_risk"]) for _, m in results],
+            dtype=np.float64,
+        )
+        best, worst, avg = arr.max(axis=0), arr.min(axis=0), arr.mean(axis=0)
 
         print(f"\nWin Rate:")
-        print(f"  Best: {max(win_rates):.1f}%")
-        print(f"  Worst: {min(win_rates):.1f}%")
-        print(f"  Average: {statistics.mean(win_rates):.1f}%")
+        print(f"  Best: {best[0]:.1f}%")
+        print(f"  Worst: {worst[0]:.1f}%")
+        print(f"  Average: {avg[0]:.1f}%")
 
         print(f"\nTotal PnL:")
-        print(f"  Best: ${max(pnls):.2f}")
-        print(f"  Worst: ${min(pnls):.2f}")
-        print(f"  Average: ${statistics.mean(pnls):.2f}")
+        print(f"  Best: ${best[1]:.2f}")
+        print(f"  Worst: ${worst[1]:.2f}")
+        print(f"  Average: ${avg[1]:.2f}")
 
         print(f"\nReturn on Risk:")
-        print(f"  Best: {max(rors):.2f}")
-        print(f"  Worst: {min(rors):.2f}")
-        print(f"  Average: {statistics.mean(rors):.2f}")
+        print(f"  Best: {best[2]:.2f}")
+        print(f"  Worst: {worst[2]:.2f}")
+        print(f"  Average: {avg[2]:.2f}")
 
         print("\n" + "=" * 120)
 
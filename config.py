@@ -4,86 +4,61 @@ Configuration settings for the arbitrage agent system.
 All settings can be overridden via environment variables with the prefix shown in comments.
 """
 
-import os
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
-
-
-def _get_env_str(key: str, default: str) -> str:
-    """Get string from environment variable"""
-    return os.environ.get(key, default)
-
-
-def _get_env_int(key: str, default: int) -> int:
-    """Get integer from environment variable"""
-    value = os.environ.get(key)
-    return int(value) if value else default
-
-
-def _get_env_float(key: str, default: float) -> float:
-    """Get float from environment variable"""
-    value = os.environ.get(key)
-    return float(value) if value else default
-
-
-def _get_env_list(key: str, default: List[str]) -> List[str]:
-    """Get list from comma-separated environment variable"""
-    value = os.environ.get(key)
-    if value:
-        return [s.strip() for s in value.split(",") if s.strip()]
-    return default
-
-
-def _get_env_tuple(key: str, default: Tuple[int, int]) -> Tuple[int, int]:
-    """Get tuple from comma-separated environment variable"""
-    value = os.environ.get(key)
-    if value:
-        parts = [int(s.strip()) for s in value.split(",")]
-        if len(parts) == 2:
-            return (parts[0], parts[1])
-    return default
-
+from types import MappingProxyType
+from typing import NamedTuple
+
+from env import (
+    ENV,
+    get_env_float,
+    get_env_int,
+    get_env_list,
+    get_env_str,
+    get_env_tuple,
+)
 
 # Binance.US Configuration
 # Env: BINANCE_API_URL
-BINANCE_US_API_URL = _get_env_str("BINANCE_API_URL", "https://api.binance.us/api/v3")
+BINANCE_US_API_URL = get_env_str("BINANCE_API_URL", "https://api.binance.us/api/v3")
 # Env: BINANCE_SYMBOLS (comma-separated, e.g., "BTCUSDT,ETHUSDT")
-BINANCE_SYMBOLS = _get_env_list("BINANCE_SYMBOLS", ["SOLUSDT", "BTCUSDT", "ETHUSDT", "XRPUSDT"])
+BINANCE_SYMBOLS = get_env_list("BINANCE_SYMBOLS", ["SOLUSDT", "BTCUSDT", "ETHUSDT", "XRPUSDT"])
 # Env: POLL_INTERVAL_BINANCE
-POLL_INTERVAL_BINANCE = _get_env_int("POLL_INTERVAL_BINANCE", 5)  # seconds
+POLL_INTERVAL_BINANCE = get_env_int("POLL_INTERVAL_BINANCE", 5)  # seconds
 # Env: BINANCE_WS_ENABLED
-BINANCE_WS_ENABLED = _get_env_str("BINANCE_WS_ENABLED", "true").lower() == "true"
+BINANCE_WS_ENABLED = get_env_str("BINANCE_WS_ENABLED", "true").lower() == "true"
 
 # Kalshi Configuration
 # Env: KALSHI_API_URL
-KALSHI_API_URL = _get_env_str(
+KALSHI_API_URL = get_env_str(
     "KALSHI_API_URL", "https://api.elections.kalshi.com/trade-api/v2"
 )
 # Env: POLL_INTERVAL_KALSHI
-POLL_INTERVAL_KALSHI = _get_env_int("POLL_INTERVAL_KALSHI", 10)  # seconds
+POLL_INTERVAL_KALSHI = get_env_int("POLL_INTERVAL_KALSHI", 10)  # seconds
 # Env: KALSHI_CRYPTO_SERIES (comma-separated)
 # Updated to include all 4 crypto series: BTC, ETH, SOL, XRP
-KALSHI_CRYPTO_SERIES = _get_env_list("KALSHI_CRYPTO_SERIES", ["KXBTC", "KXETH", "KXSOL", "KXXRP"])
+KALSHI_CRYPTO_SERIES = get_env_list("KALSHI_CRYPTO_SERIES", ["KXBTC", "KXETH", "KXSOL", "KXXRP"])
 
 # Kalshi API Authentication (for historical data access)
 # Env: KALSHI_API_KEY
-KALSHI_API_KEY = _get_env_str("KALSHI_API_KEY", "")
+KALSHI_API_KEY = get_env_str("KALSHI_API_KEY", "")
 # Env: KALSHI_PRIVATE_KEY_PATH (path to private key file for RSA signing)
-KALSHI_PRIVATE_KEY_PATH = _get_env_str("KALSHI_PRIVATE_KEY_PATH", "private_key.pem")
+KALSHI_PRIVATE_KEY_PATH = get_env_str("KALSHI_PRIVATE_KEY_PATH", "private_key.pem")
 
 # Kalshi WebSocket Configuration
 # Env: KALSHI_WS_URL
-KALSHI_WS_URL = _get_env_str(
+KALSHI_WS_URL = get_env_str(
     "KALSHI_WS_URL", "wss://api.elections.kalshi.com/trade-api/ws/v2"
 )
 # Env: KALSHI_WS_RECONNECT_DELAY
-KALSHI_WS_RECONNECT_DELAY = _get_env_int("KALSHI_WS_RECONNECT_DELAY", 5)  # seconds
+KALSHI_WS_RECONNECT_DELAY = get_env_int("KALSHI_WS_RECONNECT_DELAY", 5)  # seconds
 # Env: KALSHI_WS_HEARTBEAT_INTERVAL
-KALSHI_WS_HEARTBEAT_INTERVAL = _get_env_int(
+KALSHI_WS_HEARTBEAT_INTERVAL = get_env_int(
     "KALSHI_WS_HEARTBEAT_INTERVAL", 10
 )  # seconds
 # Env: KALSHI_WS_ENABLED
-KALSHI_WS_ENABLED = _get_env_str("KALSHI_WS_ENABLED", "true").lower() == "true"
+KALSHI_WS_ENABLED = get_env_str("KALSHI_WS_ENABLED", "true").lower() == "true"
 
 # ============================================================================
 # LIVE TRADING SAFETY GATES
@@ -100,19 +75,64 @@ KALSHI_WS_ENABLED = _get_env_str("KALSHI_WS_ENABLED", "true").lower() == "true"
 # ============================================================================
 
 # Env: KALSHI_ENABLE_LIVE_TRADING (must be "true" to enable)
-_LIVE_TRADING_ENV_VAR = _get_env_str("KALSHI_ENABLE_LIVE_TRADING", "false")
+_LIVE_TRADING_ENABLED: bool = (
+    get_env_str("KALSHI_ENABLE_LIVE_TRADING", "false").strip().lower() == "true"
+)
+# CI/automation markers are fixed for the life of the process
+_IN_CI: bool = bool(ENV.get("CI") or ENV.get("GITHUB_ACTIONS"))
 
 # Production safety limits (only apply if live trading is enabled)
 # Env: MAX_POSITION_SIZE
 # DEPLOYMENT: Based on Strategy Optimization (Step 2), set to $10 for Stage 1
 # Ultra-conservative starting position for initial validation
-MAX_POSITION_SIZE = _get_env_float("MAX_POSITION_SIZE", 10.0)  # $10 per trade (Stage 1)
+MAX_POSITION_SIZE = get_env_float("MAX_POSITION_SIZE", 10.0)  # $10 per trade (Stage 1)
 # Env: MAX_OPEN_POSITIONS
-MAX_OPEN_POSITIONS = _get_env_int("MAX_OPEN_POSITIONS", 3)
+MAX_OPEN_POSITIONS = get_env_int("MAX_OPEN_POSITIONS", 3)
 # Env: MAX_DAILY_LOSS
 # Stop trading if cumulative loss exceeds this daily threshold
 # Stage 1: $30 (conservative threshold with $10 position sizing)
-MAX_DAILY_LOSS = _get_env_float("MAX_DAILY_LOSS", 30.0)
+MAX_DAILY_LOSS = get_env_float("MAX_DAILY_LOSS", 30.0)
+
+
+# Gate probes are reused for this long; the gates are files and env vars
+# that don't change sub-second
+_GATE_CACHE_TTL_SECONDS = 1.0
+# Gate files, relative to the working directory
+_ENABLE_FILE = Path("./ENABLE_LIVE_TRADING")
+_STOP_FILE = Path("./STOP_TRADING")
+_gate_cache = {"ts": float("-inf"), "val": None}
+
+
+class GateSnapshot(NamedTuple):
+    """Result of one pass over the live trading gates"""
+
+    env_var_set: bool
+    enable_file_exists: bool
+    not_in_ci: bool
+    no_kill_switch: bool
+
+
+def _gate_snapshot() -> GateSnapshot:
+    """
+    Evaluate every live trading gate, reusing the last result for
+    _GATE_CACHE_TTL_SECONDS.
+    """
+    now = time.monotonic()
+    if now - _gate_cache["ts"] < _GATE_CACHE_TTL_SECONDS:
+        return _gate_cache["val"]
+
+    snapshot = GateSnapshot(
+        # Gate 1: Environment variable must explicitly enable live trading
+        _LIVE_TRADING_ENABLED,
+        # Gate 2: File-based confirmation (prevents accidental env var)
+        _ENABLE_FILE.exists(),
+        # Gate 3: Never allow in CI/automated environments
+        not _IN_CI,
+        # Gate 4: Check for kill switch
+        not _STOP_FILE.exists(),
+    )
+    _gate_cache.update(ts=now, val=snapshot)
+    return snapshot
 
 
 def is_live_trading_allowed() -> bool:
@@ -125,111 +145,122 @@ def is_live_trading_allowed() -> bool:
     3. NOT running in CI/automated environment
 
     The CLI must also pass --live flag and user must confirm interactively.
+    Gate results are cached for _GATE_CACHE_TTL_SECONDS.
     """
-    # Gate 1: Environment variable must explicitly enable live trading
-    if _LIVE_TRADING_ENV_VAR.lower() != "true":
-        return False
-
-    # Gate 2: File-based confirmation (prevents accidental env var)
-    enable_file = Path("./ENABLE_LIVE_TRADING")
-    if not enable_file.exists():
-        return False
-
-    # Gate 3: Never allow in CI/automated environments
-    if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
+    # The env var and CI markers are fixed for the process; the common
+    # disabled case returns without probing anything
+    if not _LIVE_TRADING_ENABLED or _IN_CI:
         return False
-
-    # Gate 4: Check for kill switch
-    if Path("./STOP_TRADING").exists():
-        return False
-
-    return True
+    return all(_gate_snapshot())
 
 
 def get_live_trading_status() -> dict:
     """Get detailed status of each live trading safety gate."""
-    return {
-        "env_var_set": _LIVE_TRADING_ENV_VAR.lower() == "true",
-        "enable_file_exists": Path("./ENABLE_LIVE_TRADING").exists(),
-        "not_in_ci": not (os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS")),
-        "no_kill_switch": not Path("./STOP_TRADING").exists(),
-        "all_gates_passed": is_live_trading_allowed(),
-    }
+    snapshot = _gate_snapshot()
+    return {**snapshot._asdict(), "all_gates_passed": all(snapshot)}
 
 
 # Analysis Configuration
 # Env: MOMENTUM_WINDOW
-MOMENTUM_WINDOW = _get_env_int("MOMENTUM_WINDOW", 20)  # minutes to analyze for momentum
+MOMENTUM_WINDOW = get_env_int("MOMENTUM_WINDOW", 20)  # minutes to analyze for momentum
 # Env: CONFIDENCE_THRESHOLD
-CONFIDENCE_THRESHOLD = _get_env_int("CONFIDENCE_THRESHOLD", 70)  # percent confidence
+CONFIDENCE_THRESHOLD = get_env_int("CONFIDENCE_THRESHOLD", 70)  # percent confidence
 
 # Arbitrage Detection Thresholds
 # Env: MIN_ODDS_SPREAD
 # Lowered to 5.0c to capture more opportunities. With 71.4% win rate,
 # breakeven trades (5c spread - 5c fees) still profit on average.
-MIN_ODDS_SPREAD = _get_env_float("MIN_ODDS_SPREAD", 5.0)  # Minimum spread (cents)
+MIN_ODDS_SPREAD = get_env_float("MIN_ODDS_SPREAD", 5.0)  # Minimum spread (cents)
 # Env: ODDS_NEUTRAL_RANGE (comma-separated, e.g., "45,55")
-ODDS_NEUTRAL_RANGE = _get_env_tuple("ODDS_NEUTRAL_RANGE", (45, 55))
+ODDS_NEUTRAL_RANGE = get_env_tuple("ODDS_NEUTRAL_RANGE", (45, 55))
+# Unpacked bounds for the per-signal neutral check
+ODDS_NEUTRAL_LOW, ODDS_NEUTRAL_HIGH = ODDS_NEUTRAL_RANGE
 # Env: STRIKE_DISTANCE_THRESHOLD_PCT (within X% of strike price)
-STRIKE_DISTANCE_THRESHOLD_PCT = _get_env_float("STRIKE_DISTANCE_THRESHOLD_PCT", 0.5)
+STRIKE_DISTANCE_THRESHOLD_PCT = get_env_float("STRIKE_DISTANCE_THRESHOLD_PCT", 0.5)
 
 # Logging Configuration
 # Env: LOG_DIR
-LOG_DIR = Path(_get_env_str("LOG_DIR", "logs"))
+LOG_DIR = Path(get_env_str("LOG_DIR", "logs"))
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-CONSOLE_COLORS = {
+CONSOLE_COLORS = MappingProxyType({
     "INFO": "\033[94m",  # Blue
     "WARNING": "\033[93m",  # Yellow
     "OPPORTUNITY": "\033[92m",  # Green
     "ERROR": "\033[91m",  # Red
     "RESET": "\033[0m",
-}
+})
+# Pre-encoded copies for writers that go straight to the binary stdout buffer
+CONSOLE_COLORS_B = MappingProxyType(
+    {level: code.encode("ascii") for level, code in CONSOLE_COLORS.items()}
+)
 
 # Agent Configuration
 # Env: AGENT_HEALTH_CHECK_INTERVAL
-AGENT_HEALTH_CHECK_INTERVAL = _get_env_int("AGENT_HEALTH_CHECK_INTERVAL", 30)  # seconds
+AGENT_HEALTH_CHECK_INTERVAL = get_env_int("AGENT_HEALTH_CHECK_INTERVAL", 30)  # seconds
 # Env: MAX_RESTART_ATTEMPTS
-MAX_RESTART_ATTEMPTS = _get_env_int("MAX_RESTART_ATTEMPTS", 3)
+MAX_RESTART_ATTEMPTS = get_env_int("MAX_RESTART_ATTEMPTS", 3)
 
 # HTTP Client Configuration
 # Env: HTTP_TIMEOUT
-HTTP_TIMEOUT = _get_env_float("HTTP_TIMEOUT", 10.0)  # seconds
+HTTP_TIMEOUT = get_env_float("HTTP_TIMEOUT", 10.0)  # seconds
 # Env: HTTP_MAX_RETRIES
-HTTP_MAX_RETRIES = _get_env_int("HTTP_MAX_RETRIES", 3)
+HTTP_MAX_RETRIES = get_env_int("HTTP_MAX_RETRIES", 3)
 # Env: CIRCUIT_BREAKER_THRESHOLD
-CIRCUIT_BREAKER_THRESHOLD = _get_env_int("CIRCUIT_BREAKER_THRESHOLD", 5)
+CIRCUIT_BREAKER_THRESHOLD = get_env_int("CIRCUIT_BREAKER_THRESHOLD", 5)
 # Env: CIRCUIT_BREAKER_RECOVERY_TIMEOUT
-CIRCUIT_BREAKER_RECOVERY_TIMEOUT = _get_env_float(
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = get_env_float(
     "CIRCUIT_BREAKER_RECOVERY_TIMEOUT", 60.0
 )
 
-# Symbol mapping between exchanges
-SYMBOL_MAP = {
-    "SOLUSDT": {"binance": "SOLUSDT", "kalshi_prefix": "KXSOL", "base": "SOL"},
-    "BTCUSDT": {"binance": "BTCUSDT", "kalshi_prefix": "KXBTC", "base": "BTC"},
-    "ETHUSDT": {"binance": "ETHUSDT", "kalshi_prefix": "KXETH", "base": "ETH"},
-    "XRPUSDT": {"binance": "XRPUSDT", "kalshi_prefix": "KXXRP", "base": "XRP"},
-}
+class SymbolInfo(NamedTuple):
+    """How one traded asset is named on each exchange"""
+
+    binance: str
+    kalshi_prefix: str
+    base: str
+
+
+# Symbol mapping between exchanges (read-only, shared by every agent)
+SYMBOL_MAP = MappingProxyType({
+    "SOLUSDT": SymbolInfo("SOLUSDT", "KXSOL", "SOL"),
+    "BTCUSDT": SymbolInfo("BTCUSDT", "KXBTC", "BTC"),
+    "ETHUSDT": SymbolInfo("ETHUSDT", "KXETH", "ETH"),
+    "XRPUSDT": SymbolInfo("XRPUSDT", "KXXRP", "XRP"),
+})
+
+# Flattened single-lookup views of SYMBOL_MAP for per-decision paths
+KALSHI_PREFIX_BY_SYMBOL = MappingProxyType(
+    {symbol: info.kalshi_prefix for symbol, info in SYMBOL_MAP.items()}
+)
+BASE_ASSET_BY_SYMBOL = MappingProxyType(
+    {symbol: info.base for symbol, info in SYMBOL_MAP.items()}
+)
+
+
+def get_kalshi_prefix(symbol: str) -> str:
+    """Kalshi series prefix for a Binance symbol (e.g. BTCUSDT -> KXBTC), or ""."""
+    return KALSHI_PREFIX_BY_SYMBOL.get(symbol, "")
+
 
 # Backtesting Configuration
 # Env: BACKTEST_TRADE_SIZE
-BACKTEST_TRADE_SIZE = _get_env_float("BACKTEST_TRADE_SIZE", 100.0)
+BACKTEST_TRADE_SIZE = get_env_float("BACKTEST_TRADE_SIZE", 100.0)
 # Env: BACKTEST_MIN_CONFIDENCE
-BACKTEST_MIN_CONFIDENCE = _get_env_float("BACKTEST_MIN_CONFIDENCE", 70.0)
+BACKTEST_MIN_CONFIDENCE = get_env_float("BACKTEST_MIN_CONFIDENCE", 70.0)
 # Env: BACKTEST_MAX_OPEN_TRADES
-BACKTEST_MAX_OPEN_TRADES = _get_env_int("BACKTEST_MAX_OPEN_TRADES", 3)
+BACKTEST_MAX_OPEN_TRADES = get_env_int("BACKTEST_MAX_OPEN_TRADES", 3)
 # Env: BACKTEST_SIGNAL_COOLDOWN (seconds)
-BACKTEST_SIGNAL_COOLDOWN = _get_env_int("BACKTEST_SIGNAL_COOLDOWN", 300)
+BACKTEST_SIGNAL_COOLDOWN = get_env_int("BACKTEST_SIGNAL_COOLDOWN", 300)
 # Env: BACKTEST_TRADE_DURATION (minutes)
-BACKTEST_TRADE_DURATION = _get_env_int("BACKTEST_TRADE_DURATION", 60)
+BACKTEST_TRADE_DURATION = get_env_int("BACKTEST_TRADE_DURATION", 60)
 # Env: BACKTEST_MIN_VOLUME_THRESHOLD
-BACKTEST_MIN_VOLUME_THRESHOLD = _get_env_int("BACKTEST_MIN_VOLUME_THRESHOLD", 20)
+BACKTEST_MIN_VOLUME_THRESHOLD = get_env_int("BACKTEST_MIN_VOLUME_THRESHOLD", 20)
 # Env: BACKTEST_TRADING_FEE_RATE (percentage)
-BACKTEST_TRADING_FEE_RATE = _get_env_float("BACKTEST_TRADING_FEE_RATE", 0.03)
+BACKTEST_TRADING_FEE_RATE = get_env_float("BACKTEST_TRADING_FEE_RATE", 0.03)
 # Env: BACKTEST_PARALLEL_BATCH_SIZE (concurrent API requests)
-BACKTEST_PARALLEL_BATCH_SIZE = _get_env_int("BACKTEST_PARALLEL_BATCH_SIZE", 25)
+BACKTEST_PARALLEL_BATCH_SIZE = get_env_int("BACKTEST_PARALLEL_BATCH_SIZE", 25)
 # Env: KALSHI_READ_LIMIT_PER_SECOND
-KALSHI_READ_LIMIT_PER_SECOND = _get_env_int("KALSHI_READ_LIMIT_PER_SECOND", 10)
+KALSHI_READ_LIMIT_PER_SECOND = get_env_int("KALSHI_READ_LIMIT_PER_SECOND", 10)
 
 # ============================================================================
 # REALISTIC SIMULATION SETTINGS (Dry-Run Mode)
@@ -238,38 +269,67 @@ KALSHI_READ_LIMIT_PER_SECOND = _get_env_int("KALSHI_READ_LIMIT_PER_SECOND", 10)
 # trading conditions like fees, slippage, partial fills, and latency.
 
 # Env: SIM_REALISTIC_MODE (enable all realistic simulations)
-SIM_REALISTIC_MODE = _get_env_str("SIM_REALISTIC_MODE", "true").lower() == "true"
-
-# Kalshi Fee Structure (per contract, in cents)
-# Kalshi charges taker fees for immediate fills
-# Env: SIM_TAKER_FEE_CENTS (typical: 2-7 cents per contract)
-SIM_TAKER_FEE_CENTS = _get_env_float("SIM_TAKER_FEE_CENTS", 3.0)
-
-# Slippage Simulation
-# Env: SIM_SLIPPAGE_BASE_CENTS (base slippage in cents)
-SIM_SLIPPAGE_BASE_CENTS = _get_env_float("SIM_SLIPPAGE_BASE_CENTS", 1.0)
-# Env: SIM_SLIPPAGE_PER_CONTRACT (additional slippage per contract)
-SIM_SLIPPAGE_PER_CONTRACT = _get_env_float("SIM_SLIPPAGE_PER_CONTRACT", 0.1)
-# Env: SIM_SLIPPAGE_VOLATILITY (random volatility factor 0-1)
-SIM_SLIPPAGE_VOLATILITY = _get_env_float("SIM_SLIPPAGE_VOLATILITY", 0.5)
-
-# Partial Fill Simulation
-# Env: SIM_FILL_RATE_BASE (base probability of full fill, 0-1)
-SIM_FILL_RATE_BASE = _get_env_float("SIM_FILL_RATE_BASE", 0.85)
-# Env: SIM_MIN_FILL_RATE (minimum fill rate when partial, 0-1)
-SIM_MIN_FILL_RATE = _get_env_float("SIM_MIN_FILL_RATE", 0.3)
-
-# Latency Simulation
-# Env: SIM_LATENCY_MS (average latency in milliseconds)
-SIM_LATENCY_MS = _get_env_int("SIM_LATENCY_MS", 250)
-# Env: SIM_LATENCY_JITTER_MS (random jitter +/- milliseconds)
-SIM_LATENCY_JITTER_MS = _get_env_int("SIM_LATENCY_JITTER_MS", 100)
-
-# Price Movement During Latency
-# Env: SIM_PRICE_MOVE_PROBABILITY (chance price moves against you during latency)
-SIM_PRICE_MOVE_PROBABILITY = _get_env_float("SIM_PRICE_MOVE_PROBABILITY", 0.3)
-# Env: SIM_PRICE_MOVE_MAX_CENTS (max adverse price move in cents)
-SIM_PRICE_MOVE_MAX_CENTS = _get_env_float("SIM_PRICE_MOVE_MAX_CENTS", 3.0)
+SIM_REALISTIC_MODE = get_env_str("SIM_REALISTIC_MODE", "true").lower() == "true"
+
+
+@dataclass(frozen=True, slots=True)
+class SimConfig:
+    """Dry-run friction parameters, bundled for the order simulation path"""
+
+    taker_fee_cents: float
+    slippage_base_cents: float
+    slippage_per_contract: float
+    slippage_volatility: float
+    fill_rate_base: float
+    min_fill_rate: float
+    latency_ms: int
+    latency_jitter_ms: int
+    price_move_probability: float
+    price_move_max_cents: float
+
+
+# SIM_REALISTIC_MODE stays a plain module flag (the CLI can switch it off);
+# the parameters are fixed once parsed
+SIM = SimConfig(
+    # Kalshi Fee Structure (per contract, in cents)
+    # Kalshi charges taker fees for immediate fills
+    # Env: SIM_TAKER_FEE_CENTS (typical: 2-7 cents per contract)
+    taker_fee_cents=get_env_float("SIM_TAKER_FEE_CENTS", 3.0),
+    # Slippage Simulation
+    # Env: SIM_SLIPPAGE_BASE_CENTS (base slippage in cents)
+    slippage_base_cents=get_env_float("SIM_SLIPPAGE_BASE_CENTS", 1.0),
+    # Env: SIM_SLIPPAGE_PER_CONTRACT (additional slippage per contract)
+    slippage_per_contract=get_env_float("SIM_SLIPPAGE_PER_CONTRACT", 0.1),
+    # Env: SIM_SLIPPAGE_VOLATILITY (random volatility factor 0-1)
+    slippage_volatility=get_env_float("SIM_SLIPPAGE_VOLATILITY", 0.5),
+    # Partial Fill Simulation
+    # Env: SIM_FILL_RATE_BASE (base probability of full fill, 0-1)
+    fill_rate_base=get_env_float("SIM_FILL_RATE_BASE", 0.85),
+    # Env: SIM_MIN_FILL_RATE (minimum fill rate when partial, 0-1)
+    min_fill_rate=get_env_float("SIM_MIN_FILL_RATE", 0.3),
+    # Latency Simulation
+    # Env: SIM_LATENCY_MS (average latency in milliseconds)
+    latency_ms=get_env_int("SIM_LATENCY_MS", 250),
+    # Env: SIM_LATENCY_JITTER_MS (random jitter +/- milliseconds)
+    latency_jitter_ms=get_env_int("SIM_LATENCY_JITTER_MS", 100),
+    # Price Movement During Latency
+    # Env: SIM_PRICE_MOVE_PROBABILITY (chance price moves against you during latency)
+    price_move_probability=get_env_float("SIM_PRICE_MOVE_PROBABILITY", 0.3),
+    # Env: SIM_PRICE_MOVE_MAX_CENTS (max adverse price move in cents)
+    price_move_max_cents=get_env_float("SIM_PRICE_MOVE_MAX_CENTS", 3.0),
+)
+
+# Flat names kept for existing callers
+SIM_TAKER_FEE_CENTS = SIM.taker_fee_cents
+SIM_SLIPPAGE_BASE_CENTS = SIM.slippage_base_cents
+SIM_SLIPPAGE_PER_CONTRACT = SIM.slippage_per_contract
+SIM_SLIPPAGE_VOLATILITY = SIM.slippage_volatility
+SIM_FILL_RATE_BASE = SIM.fill_rate_base
+SIM_MIN_FILL_RATE = SIM.min_fill_rate
+SIM_LATENCY_MS = SIM.latency_ms
+SIM_LATENCY_JITTER_MS = SIM.latency_jitter_ms
+SIM_PRICE_MOVE_PROBABILITY = SIM.price_move_probability
+SIM_PRICE_MOVE_MAX_CENTS = SIM.price_move_max_cents
 
 # ============================================================================
 # POSITION SIZING - STAGE-BASED DEPLOYMENT
@@ -307,10 +367,10 @@ SIM_PRICE_MOVE_MAX_CENTS = _get_env_float("SIM_PRICE_MOVE_MAX_CENTS", 3.0)
 #
 # RISK PROFILE (Stage 1 - Ultra-Conservative)
 # Env: STAGE_1_CAPITAL_BASE
-STAGE_1_CAPITAL_BASE = _get_env_float("STAGE_1_CAPITAL_BASE", 200.0)
+STAGE_1_CAPITAL_BASE = get_env_float("STAGE_1_CAPITAL_BASE", 200.0)
 # Env: STAGE_1_MAX_POSITION
-STAGE_1_MAX_POSITION = _get_env_float("STAGE_1_MAX_POSITION", 10.0)
+STAGE_1_MAX_POSITION = get_env_float("STAGE_1_MAX_POSITION", 10.0)
 # Env: STAGE_1_DAILY_LOSS_LIMIT
-STAGE_1_DAILY_LOSS_LIMIT = _get_env_float("STAGE_1_DAILY_LOSS_LIMIT", 30.0)
+STAGE_1_DAILY_LOSS_LIMIT = get_env_float("STAGE_1_DAILY_LOSS_LIMIT", 30.0)
 # Env: STAGE_1_MAX_DRAWDOWN_PERCENT
-STAGE_1_MAX_DRAWDOWN_PERCENT = _get_env_float("STAGE_1_MAX_DRAWDOWN_PERCENT", 10.0)
+STAGE_1_MAX_DRAWDOWN_PERCENT = get_env_float("STAGE_1_MAX_DRAWDOWN_PERCENT", 10.0)
@@ -5,6 +5,7 @@ Diagnostic tool - Check backtest status, logs, cache, and recent results.
 Usage:
     python diagnose.py
     python diagnose.py --clean-legacy
+    python diagnose.py --deep
 """
 
 import argparse
@@ -55,7 +56,7 @@ def check_logs():
     return True
 
 
-def check_cache():
+def check_cache(deep: bool = False):
     """Check cache database"""
     print("\n" + "=" * 60)
     print("CACHE DATABASE")
@@ -89,6 +90,13 @@ def check_cache():
 
         conn.close()
         print("\n✓ Cache is readable")
+
+        check = "integrity_check" if deep else "quick_check"
+        if not get_cache().verify(deep=deep, force=True):
+            print(f"\n❌ Cache failed {check}")
+            print("   Run: rm logs/cache.db")
+            return False
+        print(f"✓ Cache passed {check}")
         return True
     except Exception as e:
         print(f"\n❌ Cache is corrupted: {e}")
@@ -145,6 +153,11 @@ def main():
         action="store_true",
         help="Remove legacy trade data to save space",
     )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Run a full integrity_check on the cache (slow on large files)",
+    )
     args = parser.parse_args()
 
     if args.clean_legacy:
@@ -156,7 +169,7 @@ def main():
     print("=" * 60)
 
     logs_ok = check_logs()
-    cache_ok = check_cache()
+    cache_ok = check_cache(deep=args.deep)
     env_ok = check_environment()
 
     print("\n" + "=" * 60)
@@ -0,0 +1,58 @@
+"""
+Environment snapshot and typed getters shared by config.py and strategies.py.
+"""
+
+import os
+from typing import List, Tuple
+
+# Settings are parsed from this one-time copy of the environment, a plain
+# dict that skips os.environ's per-lookup encode/decode.
+ENV = dict(os.environ)
+
+
+def get_env_str(key: str, default: str) -> str:
+    """Get string from environment variable"""
+    return ENV.get(key, default)
+
+
+def get_env_int(key: str, default: int) -> int:
+    """Get integer from environment variable"""
+    value = ENV.get(key)
+    return int(value) if value else default
+
+
+def get_env_float(key: str, default: float) -> float:
+    """Get float from environment variable"""
+    value = ENV.get(key)
+    return float(value) if value else default
+
+
+def get_env_bool(key: str, default: bool) -> bool:
+    """Get boolean from environment variable"""
+    value = ENV.get(key, "").lower()
+    if value in ("true", "1", "yes"):
+        return True
+    if value in ("false", "0", "no"):
+        return False
+    return default
+
+
+def get_env_list(key: str, default: List[str]) -> List[str]:
+    """Get list from comma-separated environment variable"""
+    value = ENV.get(key)
+    if value:
+        # Strip each item once, then drop the empty ones
+        return [s for s in (part.strip() for part in value.split(",")) if s]
+    return default
+
+
+def get_env_tuple(key: str, default: Tuple[int, int]) -> Tuple[int, int]:
+    """Get tuple from comma-separated environment variable"""
+    value = ENV.get(key)
+    if value:
+        # Check the arity before converting; int() ignores surrounding
+        # whitespace, so no strip() is needed
+        parts = value.split(",")
+        if len(parts) == 2:
+            return (int(parts[0]), int(parts[1]))
+    return default
@@ -3,12 +3,38 @@ Event types and async event bus for the agent system.
 """
 
 import asyncio
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Type
+import json
+from dataclasses import dataclass, field, fields
+from datetime import datetime, tzinfo
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+)
 from enum import Enum
 
 
+# orjson serializes the slotted event dataclasses (datetimes and enums
+# included) straight to bytes without a to_dict() pass; it's optional
+try:
+    from orjson import OPT_SERIALIZE_NUMPY, dumps as _orjson_dumps
+
+    def _event_json(event: Any) -> bytes:
+        return _orjson_dumps(event, option=OPT_SERIALIZE_NUMPY)
+
+except ImportError:
+
+    def _event_json(event: Any) -> bytes:
+        return json.dumps(event.to_dict()).encode()
+
+
 class EventType(Enum):
     PRICE_UPDATE = "price_update"
     KALSHI_ODDS = "kalshi_odds"
@@ -16,7 +42,49 @@ class EventType(Enum):
     ALERT = "alert"
 
 
-@dataclass
+@lru_cache(maxsize=1024)
+def _iso(dt: datetime, tz: Optional[tzinfo]) -> str:
+    """
+    isoformat() memoized for bursts of events sharing a timestamp. tz is
+    part of the key because aware datetimes at the same instant compare
+    equal even when their offsets (and so their strings) differ.
+    """
+    return dt.isoformat()
+
+
+def _build_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Generate a to_dict for an event class with one expression per field,
+    picked from the field's declared type (datetime -> cached isoformat(),
+    Enum -> value, anything else as-is).
+    """
+    items = []
+    for f in fields(cls):
+        attr = f"self.{f.name}"
+        if f.type is datetime:
+            expr = f"_iso({attr}, {attr}.tzinfo)"
+        elif f.type == Optional[datetime]:
+            expr = f"(_iso({attr}, {attr}.tzinfo) if {attr} is not None else None)"
+        elif isinstance(f.type, type) and issubclass(f.type, Enum):
+            expr = f"{attr}.value"
+        else:
+            expr = attr
+        items.append(f"{f.name!r}: {expr}")
+
+    namespace: Dict[str, Any] = {}
+    exec(
+        f"def to_dict(self):\n    return {{{', '.join(items)}}}\n",
+        {"_iso": _iso},
+        namespace,
+    )
+    return namespace["to_dict"]
+
+
+# Generated to_dict functions, built on first use per event class
+_TO_DICT: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+@dataclass(slots=True)
 class BaseEvent:
     """Base class for all events"""
 
@@ -25,18 +93,18 @@ class BaseEvent:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for logging"""
-        result = {}
-        for k, v in self.__dict__.items():
-            if isinstance(v, datetime):
-                result[k] = v.isoformat()
-            elif isinstance(v, Enum):
-                result[k] = v.value
-            else:
-                result[k] = v
-        return result
-
-
-@dataclass
+        cls = type(self)
+        to_dict = _TO_DICT.get(cls)
+        if to_dict is None:
+            to_dict = _TO_DICT[cls] = _build_to_dict(cls)
+        return to_dict(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize event to JSON bytes (same fields as to_dict)"""
+        return _event_json(self)
+
+
+@dataclass(slots=True)
 class PriceUpdateEvent(BaseEvent):
     """Event emitted when price data is updated"""
 
@@ -53,7 +121,7 @@ class PriceUpdateEvent(BaseEvent):
         self.event_type = EventType.PRICE_UPDATE
 
 
-@dataclass
+@dataclass(slots=True)
 class KalshiOddsEvent(BaseEvent):
     """Event emitted when Kalshi market odds are updated"""
 
@@ -71,7 +139,7 @@ class KalshiOddsEvent(BaseEvent):
         self.event_type = EventType.KALSHI_ODDS
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageSignalEvent(BaseEvent):
     """Event emitted when arbitrage opportunity is detected"""
 
@@ -90,7 +158,7 @@ class ArbitrageSignalEvent(BaseEvent):
         self.event_type = EventType.ARBITRAGE_SIGNAL
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertEvent(BaseEvent):
     """Aggregated alert event for actionable opportunities"""
 
@@ -106,6 +174,44 @@ class AlertEvent(BaseEvent):
 # Type alias for event handlers
 EventHandler = Callable[[BaseEvent], Coroutine[Any, Any, None]]
 
+# Position of each event type in EventBus's subscriber list
+_TYPE_INDEX: Dict[EventType, int] = {t: i for i, t in enumerate(EventType)}
+
+# Specialized per-type dispatcher; None when a type has no subscribers
+Dispatcher = Optional[Callable[[BaseEvent], Awaitable[None]]]
+
+
+def _build_dispatcher(handlers: Iterable[EventHandler]) -> Dispatcher:
+    """
+    Build the function publish() calls for one event type's handlers.
+
+    Handler exceptions are swallowed in every shape so one bad subscriber
+    can't break the publisher.
+    """
+    handlers = tuple(handlers)
+    if not handlers:
+        return None
+
+    if len(handlers) == 1:
+        # Skip gather's future/task setup for the common single subscriber
+        (handler,) = handlers
+
+        async def dispatch_one(event: BaseEvent) -> None:
+            try:
+                await handler(event)
+            except Exception:
+                pass  # same as gather(return_exceptions=True) below
+
+        return dispatch_one
+
+    async def dispatch_all(event: BaseEvent) -> None:
+        await asyncio.gather(
+            *(handler(event) for handler in handlers),
+            return_exceptions=True,
+        )
+
+    return dispatch_all
+
 
 class EventBus:
     """
@@ -114,56 +220,44 @@ class EventBus:
     """
 
     def __init__(self):
-        self._subscribers: Dict[EventType, List[EventHandler]] = {
-            event_type: [] for event_type in EventType
-        }
-        self._lock = asyncio.Lock()
-        self._event_queue: asyncio.Queue[BaseEvent] = asyncio.Queue()
+        # Insertion-ordered handler sets (dict keys) indexed by _TYPE_INDEX,
+        # so subscribe/unsubscribe are O(1)
+        self._subscribers: List[Dict[EventHandler, None]] = [{} for _ in EventType]
+        # Dispatchers for the same slots, rebuilt whenever a set changes
+        self._dispatch: List[Dispatcher] = [None for _ in EventType]
         self._running = False
-        self._process_task: Optional[asyncio.Task] = None
 
     def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
-        """Subscribe a handler to an event type"""
-        self._subscribers[event_type].append(handler)
+        """Subscribe a handler to an event type (no-op if already subscribed)"""
+        slot = _TYPE_INDEX[event_type]
+        self._subscribers[slot][handler] = None
+        self._dispatch[slot] = _build_dispatcher(self._subscribers[slot])
 
     def unsubscribe(self, event_type: EventType, handler: EventHandler) -> None:
         """Unsubscribe a handler from an event type"""
-        if handler in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(handler)
+        slot = _TYPE_INDEX[event_type]
+        self._subscribers[slot].pop(handler, None)
+        self._dispatch[slot] = _build_dispatcher(self._subscribers[slot])
 
     async def publish(self, event: BaseEvent) -> None:
-        """Publish an event to all subscribers"""
-        await self._event_queue.put(event)
+        """
+        Publish an event to all subscribers.
+
+        Handlers run inline on the publisher's task and publish() returns once
+        they have all finished; handler exceptions are swallowed so one bad
+        subscriber can't break the publisher. Events published while the bus
+        is stopped are dropped.
+        """
+        if not self._running:
+            return
+        dispatch = self._dispatch[_TYPE_INDEX[event.event_type]]
+        if dispatch is not None:
+            await dispatch(event)
 
     async def start(self) -> None:
-        """Start the event bus processing loop"""
+        """Start delivering published events"""
         self._running = True
-        self._process_task = asyncio.create_task(self._process_events())
 
     async def stop(self) -> None:
-        """Stop the event bus"""
+        """Stop delivering published events"""
         self._running = False
-        if self._process_task:
-            self._process_task.cancel()
-            try:
-                await self._process_task
-            except asyncio.CancelledError:
-                pass
-
-    async def _process_events(self) -> None:
-        """Process events from the queue and dispatch to handlers"""
-        while self._running:
-            try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
-                handlers = self._subscribers.get(event.event_type, [])
-                if handlers:
-                    await asyncio.gather(
-                        *[handler(event) for handler in handlers],
-                        return_exceptions=True,
-                    )
-            except asyncio.TimeoutError:
-                continue
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"Error processing event: {e}")
@@ -10,18 +10,32 @@ Usage:
 
 import requests
 import json
+import time
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import argparse
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+def _utc_from_ms(ms: int) -> datetime:
+    """Naive UTC datetime for a Binance millisecond timestamp"""
+    return datetime.fromtimestamp(int(ms) / 1000, tz=timezone.utc).replace(tzinfo=None)
 
 class BinanceAnalyzer:
     """Analyze Binance.US price movements vs Polymarket trading patterns"""
     
     BASE_URL = "https://api.binance.us/api/v3"
+    # How long a get_klines response is reused (1m candles close every 60s)
+    KLINES_TTL = 30.0
     
     def __init__(self):
         self.session = requests.Session()
+        # (symbol, interval, limit) -> (fetched_at monotonic, klines)
+        self._kline_cache: Dict[Tuple[str, str, int], Tuple[float, List[List]]] = {}
+    
+    def clear_cache(self) -> None:
+        """Drop all cached get_klines responses"""
+        self._kline_cache.clear()
     
     def get_klines(self, symbol: str, interval: str = "1m", limit: int = 120) -> List[List]:
         """
@@ -33,8 +47,13 @@ class BinanceAnalyzer:
             limit: Number of candles to fetch
         
         Returns:
-            List of klines with OHLCV data
+            List of klines with OHLCV data (reused for KLINES_TTL seconds)
         """
+        key = (symbol, interval, limit)
+        cached = self._kline_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.KLINES_TTL:
+            return cached[1]
+        
         params = {
             "symbol": symbol,
             "interval": interval,
@@ -44,10 +63,15 @@ class BinanceAnalyzer:
         try:
             response = self.session.get(f"{self.BASE_URL}/klines", params=params)
             response.raise_for_status()
-            return response.json()
+            klines = response.json()
         except requests.exceptions.RequestException as e:
             print(f"❌ Error fetching klines: {e}")
             return []
+        
+        # Failures aren't cached so the next call retries
+        if klines:
+            self._kline_cache[key] = (time.monotonic(), klines)
+        return klines
     
     def get_historical_klines(self, symbol: str, start_time: int, end_time: int, 
                              interval: str = "1m") -> List[List]:
@@ -112,21 +136,18 @@ class BinanceAnalyzer:
             return {"error": "Could not fetch candle data"}
         
         # Convert to DataFrame for easier analysis
-        df = pd.DataFrame(klines, columns=[
+        arr = np.array(klines, dtype=object)
+        df = pd.DataFrame(arr, columns=[
             'open_time', 'open', 'high', 'low', 'close', 'volume',
             'close_time', 'quote_asset_volume', 'number_of_trades',
             'taker_buy_base', 'taker_buy_quote', 'ignore'
         ])
         
-        # Convert to numeric
-        df['open'] = pd.to_numeric(df['open'])
-        df['high'] = pd.to_numeric(df['high'])
-        df['low'] = pd.to_numeric(df['low'])
-        df['close'] = pd.to_numeric(df['close'])
-        df['volume'] = pd.to_numeric(df['volume'])
+        # Convert OHLCV to numeric in one pass over the raw rows
+        df[['open', 'high', 'low', 'close', 'volume']] = arr[:, 1:6].astype(np.float64)
         
         # Convert timestamps
-        df['timestamp'] = pd.to_datetime(df['open_time'], unit='ms')
+        df['timestamp'] = pd.to_datetime(arr[:, 0].astype(np.int64), unit='ms')
         
         return {
             "symbol": symbol,
@@ -137,6 +158,26 @@ class BinanceAnalyzer:
             "data": df.to_dict('records')
         }
     
+    def _confirmation_candles(
+        self, symbol: str
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Last hour of 1m candles as (opens, closes, open_times) arrays, or None
+        if they couldn't be fetched. Backed by the get_klines cache, so the UP
+        and DOWN checks share one request.
+        """
+        klines = self.get_klines(symbol, interval="1m", limit=60)
+        if not klines:
+            return None
+        
+        # Plain NumPy reductions; no DataFrame needed for counts and bounds
+        arr = np.array(klines, dtype=object)
+        return (
+            arr[:, 1].astype(np.float64),
+            arr[:, 4].astype(np.float64),
+            arr[:, 0].astype(np.int64),
+        )
+    
     def detect_price_confirmation(self, symbol: str, direction: str = "UP") -> Dict:
         """
         Detect if price has "confirmed" momentum (moved decisively in one direction)
@@ -148,25 +189,16 @@ class BinanceAnalyzer:
         Returns:
             Dict with confirmation analysis
         """
-        klines = self.get_klines(symbol, interval="1m", limit=60)
+        candles = self._confirmation_candles(symbol)
         
-        if not klines:
+        if candles is None:
             return {"error": "Could not fetch data"}
-        
-        df = pd.DataFrame(klines, columns=[
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base', 'taker_buy_quote', 'ignore'
-        ])
-        
-        df['open'] = pd.to_numeric(df['open'])
-        df['close'] = pd.to_numeric(df['close'])
-        df['timestamp'] = pd.to_datetime(df['open_time'], unit='ms')
+        opens, closes, times = candles
         
         # Calculate momentum metrics
-        candles_up = (df['close'] >= df['open']).sum()
-        candles_down = (df['close'] < df['open']).sum()
-        total_candles = len(df)
+        total_candles = len(closes)
+        candles_up = int(np.count_nonzero(closes >= opens))
+        candles_down = total_candles - candles_up
         
         # Check if direction is confirmed
         if direction.upper() == "UP":
@@ -185,8 +217,8 @@ class BinanceAnalyzer:
             "down_percentage": (candles_down / total_candles) * 100,
             "is_confirmed": confirmation,
             "confidence_percentage": confidence,
-            "latest_price": float(df['close'].iloc[-1]),
-            "time_range": f"{df['timestamp'].min()} to {df['timestamp'].max()}"
+            "latest_price": float(closes[-1]),
+            "time_range": f"{_utc_from_ms(times.min())} to {_utc_from_ms(times.max())}"
         }
     
     def calculate_lag_window(self, symbol: str, polymarket_entry_time: str) -> Dict:
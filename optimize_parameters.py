@@ -8,19 +8,26 @@ Usage:
     python optimize_parameters.py --quick          # 2-day test, fewer combinations
     python optimize_parameters.py --days 5         # 5-day test
     python optimize_parameters.py --full           # 7-day test, all combinations
+    python optimize_parameters.py --jobs 4         # run 4 backtests at a time
 """
 
-import subprocess
+import asyncio
 import os
 import sys
 import json
 import argparse
-import time
 from itertools import product
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Any
-import statistics
+from typing import Dict, List, Optional, Tuple, Any
+
+import pandas as pd
+
+# orjson parses the backtest result files much faster; it's optional
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
 
 # Parameters to optimize with their test values
@@ -61,22 +68,35 @@ BASE_STRATEGY_CONFIG = {
     "STRATEGY_MULTIFRAME_CONFIRMATION": "true", # Testing this
 }
 
+# Environment every backtest child starts from, built once
+_BASE_ENV = {**os.environ, **BASE_STRATEGY_CONFIG}
+
 
-def get_latest_backtest_file() -> str:
+def get_latest_backtest_file() -> Optional[str]:
     """Get the most recently created backtest file"""
-    files = sorted(
-        Path("logs").glob("backtest_real_BTCUSDT_*.json"),
-        key=lambda x: x.stat().st_mtime,
-        reverse=True,
-    )
-    return str(files[0]) if files else None
+    # One pass over the directory; only the newest file is needed
+    try:
+        with os.scandir("logs") as it:
+            latest = max(
+                (
+                    entry
+                    for entry in it
+                    if entry.name.startswith("backtest_real_BTCUSDT_")
+                    and entry.name.endswith(".json")
+                ),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return latest.path if latest else None
 
 
 def load_metrics_from_backtest(filepath: str) -> Dict[str, float]:
     """Load metrics from latest backtest result"""
     try:
-        with open(filepath, "r") as f:
-            result = json.load(f)
+        with open(filepath, "rb") as f:
+            result = _loads(f.read())
 
         summary = result.get("summary", {})
         metrics = {
@@ -111,78 +131,70 @@ def load_metrics_from_backtest(filepath: str) -> Dict[str, float]:
         return None
 
 
-def run_backtest_with_params(
-    params: Dict[str, Any], days: int = 2, verbose: bool = False
+async def run_backtest_with_params(
+    params: Dict[str, Any],
+    days: int = 2,
+    verbose: bool = False,
+    output_file: Optional[str] = None,
+    progress: bool = True,
 ) -> Dict[str, float]:
-    """Run a single backtest with specified parameters"""
-    env = os.environ.copy()
-
-    # Set base strategy config
-    for strategy, value in BASE_STRATEGY_CONFIG.items():
-        env[strategy] = value
+    """
+    Run a single backtest with specified parameters.
 
-    # Set parameter values
-    for param, value in params.items():
-        env[param] = str(value)
+    With output_file the backtest writes its results there; otherwise they
+    are read back from the newest backtest file in logs/. progress=False
+    suppresses the in-place progress line (for concurrent runs).
+    """
+    # Base strategy config is already applied; just set parameter values
+    env = _BASE_ENV.copy()
+    env.update({param: str(value) for param, value in params.items()})
 
     timeout_seconds = 600 if days <= 2 else 1200
 
     try:
-        process = subprocess.Popen(
-            [
-                "python",
-                "-u",
-                "run_backtest_real.py",
-                "--symbol",
-                "BTCUSDT",
-                "--days",
-                str(days),
-            ],
+        process = await asyncio.create_subprocess_exec(
+            "python",
+            "-u",
+            "run_backtest_real.py",
+            "--symbol",
+            "BTCUSDT",
+            "--days",
+            str(days),
+            *(["--output", output_file] if output_file else []),
             env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
         )
 
         output_lines = []
-        start_time = time.time()
-
-        while True:
-            if process.poll() is not None:
-                remaining = process.stdout.read()
-                if remaining:
-                    for line in remaining.splitlines():
-                        output_lines.append(line)
-                        if verbose:
-                            print(f"    {line}")
-                break
-
-            elapsed = time.time() - start_time
-            if elapsed > timeout_seconds:
-                process.kill()
-                print(f"\n  ⚠ Backtest timed out after {timeout_seconds}s")
-                return None
-
-            try:
-                line = process.stdout.readline()
-                if line:
-                    line = line.rstrip()
-                    output_lines.append(line)
-                    if verbose:
-                        print(f"    {line}")
-                    elif any(k in line for k in ["Progress:", "% complete"]):
-                        print(f"\r    {line[:70]:<70}", end="", flush=True)
-            except Exception:
-                time.sleep(0.1)
-
-        print("\r" + " " * 75 + "\r", end="")
+
+        async def read_output() -> None:
+            # Blocks in the event loop until the child writes or exits
+            async for raw in process.stdout:
+                line = raw.decode(errors="replace").rstrip()
+                output_lines.append(line)
+                if verbose:
+                    print(f"    {line}")
+                elif progress and any(k in line for k in ["Progress:", "% complete"]):
+                    print(f"\r    {line[:70]:<70}", end="", flush=True)
+            await process.wait()
+
+        try:
+            await asyncio.wait_for(read_output(), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            print(f"\n  ⚠ Backtest timed out after {timeout_seconds}s")
+            return None
+
+        if progress:
+            print("\r" + " " * 75 + "\r", end="")
 
         if process.returncode != 0:
             print(f"  ⚠ Backtest failed (exit code {process.returncode})")
             return None
 
-        latest = get_latest_backtest_file()
+        latest = output_file or get_latest_backtest_file()
         if latest:
             return load_metrics_from_backtest(latest)
         return None
@@ -201,12 +213,96 @@ def params_to_string(params: Dict[str, Any]) -> str:
     return " | ".join(parts)
 
 
+def print_backtest_result(metrics: Optional[Dict[str, float]]) -> None:
+    """Print the one-line outcome of a backtest"""
+    if metrics:
+        print(
+            f"  ✓ PnL: ${metrics['total_pnl']:7.2f} | "
+            f"WR: {metrics['win_rate']:5.1f}% | "
+            f"Trades: {metrics['trades']:3.0f} | "
+            f"RoR: {metrics['return_on_risk']:5.2f}"
+        )
+    else:
+        print(f"  ✗ FAILED")
+
+
+async def run_grid(
+    param_names: List[str],
+    all_combinations: List[Tuple],
+    days: int,
+    jobs: int,
+    verbose: bool = False,
+) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, float]]], int]:
+    """
+    Backtest every parameter combination, at most `jobs` at a time.
+
+    Returns (results, failed_count).
+    """
+    results: List[Tuple[Dict[str, Any], Dict[str, float]]] = []
+    failed = 0
+    total_perms = len(all_combinations)
+
+    if jobs <= 1:
+        for i, values in enumerate(all_combinations):
+            params = dict(zip(param_names, values))
+
+            print(f"[{i + 1:3d}/{total_perms:3d}] {params_to_string(params)}")
+
+            metrics = await run_backtest_with_params(params, days, verbose=verbose)
+
+            if metrics:
+                results.append((params, metrics))
+            else:
+                failed += 1
+            print_backtest_result(metrics)
+        return results, failed
+
+    # Every run writes to its own results file since "newest file in logs/"
+    # is ambiguous while several are running
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def run_one(i: int, params: Dict[str, Any]):
+        async with semaphore:
+            metrics = await run_backtest_with_params(
+                params,
+                days,
+                verbose=verbose,
+                output_file=str(Path("logs") / f"optimize_{run_id}_{i:03d}.json"),
+                progress=False,
+            )
+        return params, metrics
+
+    tasks = [
+        run_one(i, dict(zip(param_names, values)))
+        for i, values in enumerate(all_combinations)
+    ]
+    for done, next_finished in enumerate(asyncio.as_completed(tasks), 1):
+        params, metrics = await next_finished
+
+        print(f"[{done:3d}/{total_perms:3d}] {params_to_string(params)}")
+        if metrics:
+            results.append((params, metrics))
+        else:
+            failed += 1
+        print_backtest_result(metrics)
+
+    return results, failed
+
+
 def main():
     parser = argparse.ArgumentParser(description="Optimize strategy parameters")
     parser.add_argument("--quick", action="store_true", help="Quick test with fewer combinations")
     parser.add_argument("--full", action="store_true", help="Full test (7 days)")
     parser.add_argument("--days", type=int, default=None, help="Days to backtest")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Backtests to run concurrently (default: 1)",
+    )
     args = parser.parse_args()
 
     if args.days:
@@ -233,29 +329,12 @@ def main():
         print(f"  {name}: {values}")
     print(f"\nTotal combinations: {total_perms}")
     print(f"Days per backtest: {days}")
+    print(f"Concurrent jobs: {args.jobs}")
     print(f"{'=' * 100}\n")
 
-    results: List[Tuple[Dict[str, Any], Dict[str, float]]] = []
-    failed = 0
-
-    for i, values in enumerate(all_combinations):
-        params = dict(zip(param_names, values))
-
-        print(f"[{i + 1:3d}/{total_perms:3d}] {params_to_string(params)}")
-
-        metrics = run_backtest_with_params(params, days, verbose=args.verbose)
-
-        if metrics:
-            results.append((params, metrics))
-            print(
-                f"  ✓ PnL: ${metrics['total_pnl']:7.2f} | "
-                f"WR: {metrics['win_rate']:5.1f}% | "
-                f"Trades: {metrics['trades']:3.0f} | "
-                f"RoR: {metrics['return_on_risk']:5.2f}"
-            )
-        else:
-            failed += 1
-            print(f"  ✗ FAILED")
+    results, failed = asyncio.run(
+        run_grid(param_names, all_combinations, days, args.jobs, args.verbose)
+    )
 
     print(f"\n{'=' * 100}")
     print(f"RESULTS: {len(results)} successful, {failed} failed")
@@ -277,11 +356,16 @@ def generate_report(
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     output_file = f"PARAM_OPTIMIZATION_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
 
-    # Sort by different metrics
-    by_pnl = sorted(results, key=lambda x: x[1]["total_pnl"], reverse=True)
-    by_ror = sorted(results, key=lambda x: x[1]["return_on_risk"], reverse=True)
-    by_winrate = sorted(results, key=lambda x: x[1]["win_rate"], reverse=True)
-    by_score = sorted(results, key=lambda x: x[1]["risk_adjusted_score"], reverse=True)
+    # One row per result (params and metrics side by side); the default
+    # RangeIndex maps rows back to `results`
+    df = pd.DataFrame([{**p, **m} for p, m in results])
+
+    def top(frame: pd.DataFrame, col: str) -> List[Tuple[Dict[str, Any], Dict[str, float]]]:
+        """Top 10 results by col; ties keep their original order"""
+        return [results[i] for i in frame.nlargest(10, col).index]
+
+    by_pnl = top(df, "total_pnl")
+    by_ror = top(df, "return_on_risk")
 
     with open(output_file, "w") as f:
         f.write("# Parameter Optimization Results\n\n")
@@ -299,7 +383,7 @@ def generate_report(
         f.write("## Top 10 by Total P&L\n\n")
         f.write("| Rank | Parameters | P&L | Win% | Trades | Drawdown | RoR |\n")
         f.write("|------|-----------|-----|------|--------|----------|-----|\n")
-        for rank, (params, metrics) in enumerate(by_pnl[:10], 1):
+        for rank, (params, metrics) in enumerate(by_pnl, 1):
             param_str = " / ".join(f"{v}" for v in params.values())
             f.write(
                 f"| {rank} | {param_str} | "
@@ -315,7 +399,7 @@ def generate_report(
         f.write("## Top 10 by Return on Risk\n\n")
         f.write("| Rank | Parameters | RoR | P&L | Win% | Trades | Drawdown |\n")
         f.write("|------|-----------|-----|-----|------|--------|----------|\n")
-        for rank, (params, metrics) in enumerate(by_ror[:10], 1):
+        for rank, (params, metrics) in enumerate(by_ror, 1):
             param_str = " / ".join(f"{v}" for v in params.values())
             f.write(
                 f"| {rank} | {param_str} | "
@@ -328,13 +412,13 @@ def generate_report(
         f.write("\n")
 
         # Best by Win Rate (with min trades)
-        min_trades_results = [(p, m) for p, m in results if m["trades"] >= 10]
-        if min_trades_results:
-            by_wr_filtered = sorted(min_trades_results, key=lambda x: x[1]["win_rate"], reverse=True)
+        min_trades_df = df[df["trades"] >= 10]
+        if not min_trades_df.empty:
+            by_wr_filtered = top(min_trades_df, "win_rate")
             f.write("## Top 10 by Win Rate (min 10 trades)\n\n")
             f.write("| Rank | Parameters | Win% | P&L | Trades | RoR |\n")
             f.write("|------|-----------|------|-----|--------|-----|\n")
-            for rank, (params, metrics) in enumerate(by_wr_filtered[:10], 1):
+            for rank, (params, metrics) in enumerate(by_wr_filtered, 1):
                 param_str = " / ".join(f"{v}" for v in params.values())
                 f.write(
                     f"| {rank} | {param_str} | "
@@ -349,18 +433,17 @@ def generate_report(
         f.write("## Parameter Sensitivity Analysis\n\n")
         f.write("Average P&L for each parameter value:\n\n")
 
+        metric_cols = ["total_pnl", "win_rate", "trades", "return_on_risk"]
         for param_name, param_values in param_grid.items():
             f.write(f"### {param_name}\n\n")
             f.write("| Value | Avg P&L | Avg Win% | Avg Trades | Avg RoR |\n")
             f.write("|-------|---------|----------|------------|--------|\n")
 
+            # All per-value averages for this parameter in one pass
+            agg = df.groupby(param_name)[metric_cols].mean()
             for value in param_values:
-                matching = [(p, m) for p, m in results if p[param_name] == value]
-                if matching:
-                    avg_pnl = statistics.mean(m["total_pnl"] for _, m in matching)
-                    avg_wr = statistics.mean(m["win_rate"] for _, m in matching)
-                    avg_trades = statistics.mean(m["trades"] for _, m in matching)
-                    avg_ror = statistics.mean(m["return_on_risk"] for _, m in matching)
+                if value in agg.index:
+                    avg_pnl, avg_wr, avg_trades, avg_ror = agg.loc[value]
                     f.write(f"| {value} | ${avg_pnl:.2f} | {avg_wr:.1f}% | {avg_trades:.1f} | {avg_ror:.2f} |\n")
             f.write("\n")
 
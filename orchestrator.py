@@ -6,7 +6,7 @@ Manages agent lifecycle, event bus, and graceful shutdown.
 
 import asyncio
 import signal
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from events import EventBus
 from agents import (
@@ -36,6 +36,10 @@ class Orchestrator:
         self.agents: List[BaseAgent] = []
         self._shutdown_event = asyncio.Event()
         self._health_task: Optional[asyncio.Task] = None
+        # Names of all agents, and of those started and not yet stopped
+        # (maintained here so the health check needn't poll each agent)
+        self._agent_names: List[str] = []
+        self._running_agents: Set[str] = set()
 
     def _create_agents(self) -> None:
         """Instantiate all agents"""
@@ -54,6 +58,8 @@ class Orchestrator:
         self.agents.append(ArbitrageDetectorAgent(self.event_bus))
         self.agents.append(SignalAggregatorAgent(self.event_bus))
 
+        self._agent_names = [agent.name for agent in self.agents]
+
     async def start(self) -> None:
         """Start the orchestrator and all agents"""
         print("\n" + "=" * 60)
@@ -61,19 +67,31 @@ class Orchestrator:
         print("  Binance.US <-> Kalshi")
         print("=" * 60 + "\n")
 
-        # Setup signal handlers
+        # Setup signal handlers (unsupported on Windows event loops, where
+        # Ctrl+C still surfaces as KeyboardInterrupt through asyncio.run)
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
-            loop.add_signal_handler(sig, self._signal_handler)
+            try:
+                loop.add_signal_handler(sig, self._signal_handler)
+            except NotImplementedError:
+                break
 
         # Initialize event bus
         await self.event_bus.start()
         print("[Orchestrator] Event bus started")
 
-        # Create and start agents
+        # Create and start agents concurrently so their startup overlaps
         self._create_agents()
+        async with asyncio.TaskGroup() as tg:
+            for agent in self.agents:
+                tg.create_task(agent.start())
         for agent in self.agents:
-            await agent.start()
+            self._running_agents.add(agent.name)
+            # Drop the agent from the running set as soon as its loop exits
+            if agent._task is not None:
+                agent._task.add_done_callback(
+                    lambda _task, name=agent.name: self._running_agents.discard(name)
+                )
 
         # Start health monitoring
         self._health_task = asyncio.create_task(self._health_monitor())
@@ -96,9 +114,12 @@ class Orchestrator:
             except asyncio.CancelledError:
                 pass
 
-        # Stop agents in reverse order
-        for agent in reversed(self.agents):
-            await agent.stop()
+        # Stop agents concurrently; one failing stop() mustn't block the rest
+        await asyncio.gather(
+            *(agent.stop() for agent in self.agents),
+            return_exceptions=True,
+        )
+        self._running_agents.clear()
 
         # Stop event bus
         await self.event_bus.stop()
@@ -116,7 +137,9 @@ class Orchestrator:
                 await asyncio.sleep(config.AGENT_HEALTH_CHECK_INTERVAL)
 
                 unhealthy = [
-                    agent.name for agent in self.agents if not agent.is_running
+                    name
+                    for name in self._agent_names
+                    if name not in self._running_agents
                 ]
 
                 if unhealthy:
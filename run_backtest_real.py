@@ -12,6 +12,7 @@ Requirements:
 Usage:
     python run_backtest_real.py --symbol BTCUSDT --days 7
     python run_backtest_real.py --symbol BTCUSDT --start 2026-01-01 --end 2026-01-14
+    python run_backtest_real.py --symbol BTCUSDT --days 2 --output logs/run.json
 """
 
 import argparse
@@ -22,6 +23,7 @@ import logging
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -88,6 +90,7 @@ class RealKalshiBacktester:
         end_date: Optional[datetime] = None,
         initial_capital: float = 10000.0,
         trading_fee_rate: float = 0.03,  # 3% estimate (Kalshi taker fees + slippage)
+        output_path: Optional[str] = None,  # JSON results file (default: timestamped in LOG_DIR)
     ):
         self.symbol = symbol
         self.start_date = start_date or (datetime.now() - timedelta(days=7))
@@ -95,6 +98,7 @@ class RealKalshiBacktester:
         self.initial_capital = initial_capital
         self.capital = initial_capital
         self.trading_fee_rate = trading_fee_rate
+        self.output_path = output_path
 
         # Clients
         self.kalshi_client = KalshiHistoricalClient()
@@ -623,15 +627,15 @@ class RealKalshiBacktester:
         # STRATEGY: Dynamic Neutral Range
         if strategies.STRATEGY_DYNAMIC_NEUTRAL_RANGE:
             if spread >= 25:
-                neutral_range = (40, 60)
+                neutral_low, neutral_high = 40, 60
             elif spread >= 15:
-                neutral_range = (45, 55)
+                neutral_low, neutral_high = 45, 55
             else:
-                neutral_range = (47, 53)
+                neutral_low, neutral_high = 47, 53
         else:
-            neutral_range = config.ODDS_NEUTRAL_RANGE
+            neutral_low, neutral_high = config.ODDS_NEUTRAL_LOW, config.ODDS_NEUTRAL_HIGH
 
-        odds_neutral = neutral_range[0] <= kalshi_yes <= neutral_range[1]
+        odds_neutral = neutral_low <= kalshi_yes <= neutral_high
         if not odds_neutral:
             return None
 
@@ -969,10 +973,13 @@ class RealKalshiBacktester:
             ],
         }
 
-        path = (
-            config.LOG_DIR
-            / f"backtest_real_{result.symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        )
+        if self.output_path:
+            path = Path(self.output_path)
+        else:
+            path = (
+                config.LOG_DIR
+                / f"backtest_real_{result.symbol}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            )
         path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(path, "w") as f:
@@ -1028,6 +1035,9 @@ async def main():
     parser.add_argument(
         "--cache-only", action="store_true", help="Use only cached data (faster)"
     )
+    parser.add_argument(
+        "--output", help="Write JSON results here instead of a timestamped log file"
+    )
     args = parser.parse_args()
 
     if args.start:
@@ -1045,6 +1055,7 @@ async def main():
         start_date=start,
         end_date=end,
         initial_capital=args.capital,
+        output_path=args.output,
     )
 
     # Add timeout for data loading